@@ -78,6 +78,7 @@ def cmd_update(args):
 
     today = date.today()
     counts = update_all_indicators(project_data.items, today)
+    project_data.touch()
 
     # Update metadata
     project_data.metadata.indicators_updated = today
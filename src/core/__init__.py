@@ -1,28 +1,42 @@
 # RAID Manager Core Module
 # Pure business logic - no UI dependencies
+#
+# Re-exports load on first access (PEP 562), so importing one submodule such
+# as src.core.models doesn't also pull in yaml_store/PyYAML, exports, etc.
 
-from .models import (
-    Item, Note, ProjectData, ProjectMetadata,
-    BudgetData, BudgetMetadata, BudgetLedgerEntry, RateCardEntry, TimesheetEntry
-)
-from .yaml_store import YamlStore
-from .indicators import calculate_indicator, INDICATOR_CONFIG
-from .budget import BudgetCalculator
-from .exports import Exporter
+from importlib import import_module
 
-__all__ = [
-    'Item',
-    'Note',
-    'ProjectData',
-    'ProjectMetadata',
-    'BudgetData',
-    'BudgetMetadata',
-    'BudgetLedgerEntry',
-    'RateCardEntry',
-    'TimesheetEntry',
-    'YamlStore',
-    'calculate_indicator',
-    'INDICATOR_CONFIG',
-    'BudgetCalculator',
-    'Exporter',
-]
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'Item': '.models',
+    'Note': '.models',
+    'ProjectData': '.models',
+    'ProjectMetadata': '.models',
+    'BudgetData': '.models',
+    'BudgetMetadata': '.models',
+    'BudgetLedgerEntry': '.models',
+    'RateCardEntry': '.models',
+    'TimesheetEntry': '.models',
+    'YamlStore': '.yaml_store',
+    'calculate_indicator': '.indicators',
+    'INDICATOR_CONFIG': '.indicators',
+    'BudgetCalculator': '.budget',
+    'calculate_budget': '.budget',
+    'Exporter': '.exports',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
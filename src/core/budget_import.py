@@ -180,7 +180,7 @@ def import_openair_csv(
     # Calculate totals
     total_hours = sum(e.hours for e in new_entries)
     total_cost = sum(e.cost for e in new_entries)
-    weeks_with_data = len(set(e.week_ending for e in new_entries))
+    weeks_with_data = len({e.week_ending for e in new_entries})
 
     # Replace timesheet data
     budget_data.timesheet_data = new_entries
@@ -4,16 +4,56 @@ Generates reports in various formats (Markdown, CSV).
 """
 
 import csv
+from collections import Counter
 from datetime import date
 from pathlib import Path
 from typing import Optional
 from io import StringIO
 
 from .models import Item, ProjectData
-from .indicators import INDICATOR_ORDER, get_indicator_config
+from .indicators import INDICATOR_ORDER, INDICATOR_SEVERITY
 from .budget import CalculatedBudget, format_currency, format_currency_full
 
 
+CSV_HEADER = (
+    'Item #', 'Type', 'Workstream', 'Title', 'Description',
+    'Assigned To', 'Start', 'Finish', 'Deadline',
+    '% Complete', 'Indicator', 'Priority', 'Draft', 'Client Visible',
+)
+
+MD_TABLE_HEADER = (
+    "| # | Type | Title | Assigned | Status | % |",
+    "|---|------|-------|----------|--------|---|",
+)
+
+MD_STATUS_HEADER = (
+    "## Status Summary\n",
+    "| Indicator | Count |",
+    "|-----------|-------|",
+)
+
+
+def _csv_row(item: Item) -> tuple:
+    """Build the CSV row for one item (column order matches CSV_HEADER)"""
+    start, finish, deadline = item.start, item.finish, item.deadline
+    return (
+        item.item_num,
+        item.type,
+        item.workstream or '',
+        item.title,
+        item.description or '',
+        item.assigned_to or '',
+        start.isoformat() if start else '',
+        finish.isoformat() if finish else '',
+        deadline.isoformat() if deadline else '',
+        item.percent_complete,
+        item.indicator or '',
+        item.priority or '',
+        'Yes' if item.draft else 'No',
+        'Yes' if item.client_visible else 'No',
+    )
+
+
 class Exporter:
     """Exports RAID data to various formats"""
 
@@ -33,37 +73,23 @@ class Exporter:
         lines.append(f"# {self.data.metadata.project_name} - Active Items")
         lines.append(f"*Generated: {today.strftime('%Y-%m-%d')}*\n")
 
-        # Group by severity
-        critical = []
-        warning = []
-        active = []
+        # Group by severity in one pass; completed/done indicators have no
+        # bucket, so complete items drop out here too
+        critical: list[Item] = []
+        warning: list[Item] = []
+        active: list[Item] = []
+        buckets = {'critical': critical, 'warning': warning, 'active': active, 'upcoming': active}
 
         for item in self.data.items:
-            if item.is_complete or item.draft:
+            if item.draft:
                 continue
-            config = get_indicator_config(item.indicator)
-            if config:
-                if config.severity == 'critical':
-                    critical.append(item)
-                elif config.severity == 'warning':
-                    warning.append(item)
-                elif config.severity in ('active', 'upcoming'):
-                    active.append(item)
-
-        if critical:
-            lines.append("## 🔴 Critical\n")
-            for item in critical:
-                lines.append(self._format_item_md(item))
-
-        if warning:
-            lines.append("\n## 🟡 Warning\n")
-            for item in warning:
-                lines.append(self._format_item_md(item))
-
-        if active:
-            lines.append("\n## 🔵 Active\n")
-            for item in active:
-                lines.append(self._format_item_md(item))
+            bucket = buckets.get(INDICATOR_SEVERITY.get(item.indicator))
+            if bucket is not None:
+                bucket.append(item)
+
+        self._append_section_md(lines, "## 🔴 Critical\n", critical)
+        self._append_section_md(lines, "\n## 🟡 Warning\n", warning)
+        self._append_section_md(lines, "\n## 🔵 Active\n", active)
 
         return '\n'.join(lines)
 
@@ -76,18 +102,13 @@ class Exporter:
         lines.append(f"*Generated: {today.strftime('%Y-%m-%d')}*\n")
 
         # Count by indicator
-        counts: dict[str, int] = {}
-        for item in self.data.items:
-            key = item.indicator or "No Indicator"
-            counts[key] = counts.get(key, 0) + 1
-
-        lines.append("## Status Summary\n")
-        lines.append("| Indicator | Count |")
-        lines.append("|-----------|-------|")
+        counts = Counter(item.indicator or "No Indicator" for item in self.data.items)
 
-        for indicator in INDICATOR_ORDER:
-            if indicator in counts:
-                lines.append(f"| {indicator} | {counts[indicator]} |")
+        lines.extend(MD_STATUS_HEADER)
+        lines.extend(
+            f"| {indicator} | {counts[indicator]} |"
+            for indicator in INDICATOR_ORDER if indicator in counts
+        )
 
         if "No Indicator" in counts:
             lines.append(f"| No Indicator | {counts['No Indicator']} |")
@@ -112,19 +133,21 @@ class Exporter:
         if items is None:
             items = self.data.items
 
-        lines = []
-        lines.append("| # | Type | Title | Assigned | Status | % |")
-        lines.append("|---|------|-------|----------|--------|---|")
-
-        for item in items:
-            indicator = item.indicator or "-"
-            lines.append(
-                f"| {item.item_num} | {item.type} | {item.title[:50]} | "
-                f"{item.assigned_to or '-'} | {indicator} | {item.percent_complete}% |"
-            )
+        lines = list(MD_TABLE_HEADER)
+        lines.extend(
+            f"| {item.item_num} | {item.type} | {item.title[:50]} | "
+            f"{item.assigned_to or '-'} | {item.indicator or '-'} | {item.percent_complete}% |"
+            for item in items
+        )
 
         return '\n'.join(lines)
 
+    def _append_section_md(self, lines: list[str], heading: str, items: list[Item]) -> None:
+        """Append a heading plus one entry per item; empty sections are skipped"""
+        if items:
+            lines.append(heading)
+            lines.extend(map(self._format_item_md, items))
+
     def _format_item_md(self, item: Item) -> str:
         """Format a single item for markdown"""
         parts = [f"- **#{item.item_num}** {item.title}"]
@@ -153,45 +176,18 @@ class Exporter:
 
         output = StringIO()
         writer = csv.writer(output)
-
-        # Header
-        writer.writerow([
-            'Item #', 'Type', 'Workstream', 'Title', 'Description',
-            'Assigned To', 'Start', 'Finish', 'Deadline',
-            '% Complete', 'Indicator', 'Priority', 'Draft', 'Client Visible'
-        ])
-
-        # Data rows
-        for item in items:
-            writer.writerow([
-                item.item_num,
-                item.type,
-                item.workstream or '',
-                item.title,
-                item.description or '',
-                item.assigned_to or '',
-                item.start.strftime('%Y-%m-%d') if item.start else '',
-                item.finish.strftime('%Y-%m-%d') if item.finish else '',
-                item.deadline.strftime('%Y-%m-%d') if item.deadline else '',
-                item.percent_complete,
-                item.indicator or '',
-                item.priority or '',
-                'Yes' if item.draft else 'No',
-                'Yes' if item.client_visible else 'No'
-            ])
+        writer.writerow(CSV_HEADER)
+        writer.writerows(map(_csv_row, items))
 
         return output.getvalue()
 
     def save_csv(self, filepath: Path, items: Optional[list[Item]] = None) -> None:
         """Save items to CSV file"""
-        content = self.to_csv(items)
-        with open(filepath, 'w', encoding='utf-8', newline='') as f:
-            f.write(content)
+        Path(filepath).write_bytes(self.to_csv(items).encode('utf-8'))
 
     def save_markdown(self, filepath: Path, content: str) -> None:
-        """Save markdown content to file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        """Save markdown content to file (UTF-8, LF line endings)"""
+        Path(filepath).write_bytes(content.encode('utf-8'))
 
     # -------------------------------------------------------------------------
     # Filtered Exports
@@ -199,20 +195,20 @@ class Exporter:
 
     def get_open_items(self) -> list[Item]:
         """Get all non-completed items"""
-        return [i for i in self.data.items if i.is_open]
+        return list(self.data.open_items)
 
     def get_critical_items(self) -> list[Item]:
         """Get items with critical status"""
-        return [i for i in self.data.items if i.is_critical]
+        return list(self.data.critical_items)
 
     def get_items_by_assignee(self, assignee: str) -> list[Item]:
         """Get items for a specific assignee"""
-        return [i for i in self.data.items if i.assigned_to == assignee]
+        return list(self.data.items_by_assignee.get(assignee, ()))
 
     def get_items_by_type(self, item_type: str) -> list[Item]:
         """Get items of a specific type"""
-        return [i for i in self.data.items if i.type == item_type]
+        return list(self.data.items_by_type.get(item_type, ()))
 
     def get_items_by_workstream(self, workstream: str) -> list[Item]:
         """Get items in a specific workstream"""
-        return [i for i in self.data.items if i.workstream == workstream]
+        return list(self.data.items_by_workstream.get(workstream, ()))
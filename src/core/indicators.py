@@ -3,6 +3,7 @@ Indicator calculation logic for RAID Manager.
 Determines the status indicator for each item based on dates and progress.
 """
 
+from collections import Counter
 from datetime import date, timedelta
 from typing import Optional
 from dataclasses import dataclass
@@ -105,8 +106,24 @@ INDICATOR_CONFIG = {
     ),
 }
 
+# Get the configuration for an indicator (None for a missing/unknown name).
+# Bound dict lookup: cheaper per call than a wrapper function or lru_cache,
+# and it still sees any later edits to INDICATOR_CONFIG.
+get_indicator_config = INDICATOR_CONFIG.get
+
+# Window for "Completed Recently", "Finishing Soon!" and "Starting Soon!"
+SOON_WINDOW = timedelta(days=14)
+
 # Severity ordering for sorting
 SEVERITY_ORDER = ['critical', 'warning', 'active', 'upcoming', 'completed', 'done']
+SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_ORDER)}
+
+# Severity and sort rank per indicator name; unknown indicators and None sort last
+INDICATOR_SEVERITY = {name: config.severity for name, config in INDICATOR_CONFIG.items()}
+INDICATOR_SEVERITY_RANK = {
+    name: SEVERITY_RANK.get(severity, len(SEVERITY_ORDER))
+    for name, severity in INDICATOR_SEVERITY.items()
+}
 
 # Indicator ordering for display
 INDICATOR_ORDER = [
@@ -123,17 +140,29 @@ INDICATOR_ORDER = [
 ]
 
 
+# WEEKDAY_LUT[weekday][n] = business days in the n days starting on weekday
+# (Monday = 0, Friday = 4), for partial weeks of 0-6 days
+WEEKDAY_LUT = tuple(
+    tuple(sum(1 for k in range(n) if (weekday + k) % 7 < 5) for n in range(7))
+    for weekday in range(7)
+)
+
+
+def _networkdays_ord(start_ord: int, end_ord: int) -> int:
+    """Business days between two date ordinals (inclusive), in constant time."""
+    days = end_ord - start_ord + 1
+    if days <= 0:
+        return 0
+    full_weeks, rem = divmod(days, 7)
+    # Ordinal 1 (0001-01-01) is a Monday
+    return full_weeks * 5 + WEEKDAY_LUT[(start_ord - 1) % 7][rem]
+
+
 def networkdays(start_date: date, end_date: date) -> int:
     """Calculate business days between two dates (inclusive)."""
     if not start_date or not end_date:
         return 0
-    days = 0
-    current = start_date
-    while current <= end_date:
-        if current.weekday() < 5:  # Monday = 0, Friday = 4
-            days += 1
-        current += timedelta(days=1)
-    return days
+    return _networkdays_ord(start_date.toordinal(), end_date.toordinal())
 
 
 def calculate_indicator(item: Item, today: Optional[date] = None) -> Optional[str]:
@@ -154,7 +183,16 @@ def calculate_indicator(item: Item, today: Optional[date] = None) -> Optional[st
     """
     if today is None:
         today = date.today()
+    return _indicator_for(item, today, today - SOON_WINDOW, today + SOON_WINDOW)
+
 
+def _indicator_for(item: Item, today: date, recent_cutoff: date, soon_cutoff: date) -> Optional[str]:
+    """
+    Indicator rules for one item.
+
+    The cutoffs (today -/+ SOON_WINDOW) are passed in so batch callers
+    compute them once rather than per item.
+    """
     # Draft items get no indicator
     if item.draft:
         return None
@@ -165,14 +203,10 @@ def calculate_indicator(item: Item, today: Optional[date] = None) -> Optional[st
     deadline = item.deadline
     duration = item.duration
 
-    soon_window = timedelta(days=14)
-
-    # 1. Completed Recently
-    if percent == 100 and finish and finish >= today - soon_window:
-        return "Completed Recently"
-
-    # 2. Completed
+    # 1-2. Completed items: nothing below applies to them
     if percent == 100:
+        if finish and finish >= recent_cutoff:
+            return "Completed Recently"
         return "Completed"
 
     # 3. Beyond Deadline!!!
@@ -195,15 +229,15 @@ def calculate_indicator(item: Item, today: Optional[date] = None) -> Optional[st
             return "Trending Late!"
 
     # 7. Finishing Soon!
-    if finish and finish <= today + soon_window and percent < 100:
+    if finish and finish <= soon_cutoff and percent < 100:
         return "Finishing Soon!"
 
     # 8. Starting Soon!
-    if percent == 0 and start and start <= today + soon_window and start >= today:
+    if percent == 0 and start and today <= start <= soon_cutoff:
         return "Starting Soon!"
 
     # 9. In Progress
-    if percent > 0 and percent < 100:
+    if 0 < percent < 100:
         return "In Progress"
 
     # 10. Default - Not Started (for items with dates but 0%)
@@ -217,39 +251,26 @@ def update_all_indicators(items: list[Item], today: Optional[date] = None) -> di
     """
     Update indicators for all items in place.
     Returns a count of each indicator type.
+
+    Call touch() on the owning ProjectData afterwards so its cached
+    open/critical views see the new indicators.
     """
     if today is None:
         today = date.today()
 
-    counts: dict[str, int] = {}
+    recent_cutoff = today - SOON_WINDOW
+    soon_cutoff = today + SOON_WINDOW
 
     for item in items:
-        indicator = calculate_indicator(item, today)
-        item.indicator = indicator
-
-        key = indicator or "No Indicator"
-        counts[key] = counts.get(key, 0) + 1
-
-    return counts
+        item.indicator = _indicator_for(item, today, recent_cutoff, soon_cutoff)
 
-
-def get_indicator_config(indicator: Optional[str]) -> Optional[IndicatorConfig]:
-    """Get the configuration for an indicator"""
-    if indicator is None:
-        return None
-    return INDICATOR_CONFIG.get(indicator)
+    return dict(Counter(item.indicator or "No Indicator" for item in items))
 
 
 def sort_by_severity(items: list[Item]) -> list[Item]:
     """Sort items by indicator severity (most critical first)"""
-    def severity_key(item: Item) -> tuple[int, str]:
-        config = get_indicator_config(item.indicator)
-        if config is None:
-            return (len(SEVERITY_ORDER), item.title or '')
-        try:
-            severity_idx = SEVERITY_ORDER.index(config.severity)
-        except ValueError:
-            severity_idx = len(SEVERITY_ORDER)
-        return (severity_idx, item.title or '')
-
-    return sorted(items, key=severity_key)
+    last = len(SEVERITY_ORDER)
+    return sorted(
+        items,
+        key=lambda item: (INDICATOR_SEVERITY_RANK.get(item.indicator, last), item.title or ''),
+    )
@@ -5,7 +5,7 @@ These are pure dataclasses with no external dependencies.
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
+from typing import ClassVar, Iterable, Optional, Sequence
 from enum import Enum
 
 
@@ -34,7 +34,7 @@ class Indicator(Enum):
     COMPLETED_RECENTLY = "Completed Recently"
 
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     """A timestamped note entry"""
     date: date
@@ -42,10 +42,11 @@ class Note:
 
     def to_string(self) -> str:
         """Format as > MM/DD/YY - text"""
-        return f"> {self.date.strftime('%m/%d/%y')} - {self.text}"
+        d = self.date
+        return f"> {d.month:02d}/{d.day:02d}/{d.year % 100:02d} - {self.text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """A RAID log item"""
     item_num: int
@@ -54,7 +55,7 @@ class Item:
     workstream: Optional[str] = None
     description: Optional[str] = None
     assigned_to: Optional[str] = None
-    dep_item_num: list[int] = field(default_factory=list)
+    dep_item_num: Sequence[int] = ()
     start: Optional[date] = None
     finish: Optional[date] = None
     duration: Optional[int] = None
@@ -62,7 +63,7 @@ class Item:
     draft: bool = False
     client_visible: bool = True
     percent_complete: int = 0
-    rpt_out: list[str] = field(default_factory=list)
+    rpt_out: Sequence[str] = ()
     created_date: Optional[date] = None
     last_updated: Optional[date] = None
     notes: Optional[str] = None
@@ -70,33 +71,67 @@ class Item:
     priority: Optional[str] = None
     budget_amount: Optional[float] = None  # For Budget type items
 
+    # Status state of each indicator - the single source for the groups below
+    INDICATOR_STATE: ClassVar[dict[str, str]] = {
+        'Completed': 'complete',
+        'Completed Recently': 'complete',
+        'Done': 'complete',
+        'Closed': 'complete',
+        'Cancelled': 'complete',
+        'Resolved': 'complete',
+        'In Progress': 'active',
+        'Finishing Soon!': 'active',
+        'Starting Soon!': 'active',
+        'Beyond Deadline!!!': 'critical',
+        'Late Finish!!': 'critical',
+        'Late Start!!': 'critical',
+        'Trending Late!': 'warning',
+    }
+
+    # Per-state groups for the status properties; a frozenset probe is
+    # cheaper than INDICATOR_STATE.get() plus a string compare
+    COMPLETE_INDICATORS: ClassVar[frozenset[str]] = frozenset(
+        name for name, state in INDICATOR_STATE.items() if state == 'complete')
+    ACTIVE_INDICATORS: ClassVar[frozenset[str]] = frozenset(
+        name for name, state in INDICATOR_STATE.items() if state == 'active')
+    CRITICAL_INDICATORS: ClassVar[frozenset[str]] = frozenset(
+        name for name, state in INDICATOR_STATE.items() if state == 'critical')
+    WARNING_INDICATORS: ClassVar[frozenset[str]] = frozenset(
+        name for name, state in INDICATOR_STATE.items() if state == 'warning')
+
+    @property
+    def state(self) -> Optional[str]:
+        """Status state for the indicator ('complete', 'active', 'critical',
+        'warning'), or None if the indicator has none"""
+        return Item.INDICATOR_STATE.get(self.indicator)
+
     @property
     def is_complete(self) -> bool:
         """Check if item is in a completed state"""
-        return self.indicator in ['Completed', 'Completed Recently', 'Done', 'Closed', 'Cancelled', 'Resolved']
+        return self.indicator in Item.COMPLETE_INDICATORS
 
     @property
     def is_open(self) -> bool:
         """Check if item is still open (not complete)"""
-        return not self.is_complete
+        return self.indicator not in Item.COMPLETE_INDICATORS
 
     @property
     def is_active(self) -> bool:
         """Check if item is actively being worked"""
-        return self.indicator in ['In Progress', 'Finishing Soon!', 'Starting Soon!']
+        return self.indicator in Item.ACTIVE_INDICATORS
 
     @property
     def is_critical(self) -> bool:
         """Check if item has critical status"""
-        return self.indicator in ['Beyond Deadline!!!', 'Late Finish!!', 'Late Start!!']
+        return self.indicator in Item.CRITICAL_INDICATORS
 
     @property
     def is_warning(self) -> bool:
         """Check if item has warning status"""
-        return self.indicator in ['Trending Late!']
+        return self.indicator in Item.WARNING_INDICATORS
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMetadata:
     """RAID log metadata"""
     project_name: str
@@ -106,10 +141,10 @@ class ProjectMetadata:
     project_start: Optional[date] = None
     project_end: Optional[date] = None
     indicators_updated: Optional[date] = None
-    workstreams: list[str] = field(default_factory=list)
+    workstreams: Sequence[str] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class RateCardEntry:
     """A resource rate card entry"""
     name: str
@@ -118,7 +153,7 @@ class RateCardEntry:
     roll_off_date: Optional[date] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TimesheetEntry:
     """A timesheet data entry"""
     week_ending: date
@@ -129,7 +164,7 @@ class TimesheetEntry:
     complete_week: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetLedgerEntry:
     """A budget ledger entry (additions/changes to budget)"""
     amount: float
@@ -137,7 +172,7 @@ class BudgetLedgerEntry:
     note: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetMetadata:
     """Budget file metadata"""
     project_name: str
@@ -148,7 +183,7 @@ class BudgetMetadata:
     data_source: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BudgetData:
     """Complete budget data structure"""
     metadata: BudgetMetadata
@@ -157,31 +192,105 @@ class BudgetData:
     timesheet_data: list[TimesheetEntry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectData:
-    """Complete RAID log data structure"""
+    """Complete RAID log data structure
+
+    Lookup views (items_by_num, items_by_type/assignee/workstream,
+    open_items, critical_items) are built on first use and cached. They
+    rebuild by themselves when items is reassigned or changes length
+    (append/remove). Editing fields of an existing item, or swapping one
+    item for another in place, isn't detected - call touch() after that.
+    """
     metadata: ProjectMetadata
-    items: list[Item] = field(default_factory=list)
+    items: Sequence[Item] = field(default_factory=list)
+    _cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    # What the cached views were built from: the items object itself, plus
+    # its length and the touch() count at the time
+    _cache_items: Optional[Sequence[Item]] = field(default=None, init=False, repr=False, compare=False)
+    _cache_stamp: tuple = field(default=(), init=False, repr=False, compare=False)
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_iter(cls, metadata: ProjectMetadata, items: Iterable[Item]) -> 'ProjectData':
+        """Build project data holding items as an immutable tuple"""
+        return cls(metadata=metadata, items=tuple(items))
+
+    def touch(self) -> None:
+        """Mark items as changed - cached views are rebuilt on next access"""
+        self._version += 1
+        self._cache.clear()
+
+    def _cached(self, key: str, build):
+        """Return the cached view for key, building it if needed"""
+        items = self.items
+        stamp = (len(items), self._version)
+        if self._cache_items is not items or self._cache_stamp != stamp:
+            # items reassigned, resized or touch()ed since the views were built
+            self._cache.clear()
+            self._cache_items = items
+            self._cache_stamp = stamp
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = build()
+            return value
+
+    def _grouped(self, attr: str) -> dict:
+        """Items grouped by the value of one attribute (cached)"""
+        def build():
+            buckets: dict = {}
+            for item in self.items:
+                buckets.setdefault(getattr(item, attr), []).append(item)
+            return {k: tuple(v) for k, v in buckets.items()}
+        return self._cached(f'by_{attr}', build)
+
+    @property
+    def items_by_num(self) -> dict[int, Item]:
+        """Items keyed by item number (first occurrence wins)"""
+        return self._cached('by_num', lambda: {i.item_num: i for i in reversed(self.items)})
+
+    @property
+    def items_by_type(self) -> dict[str, tuple[Item, ...]]:
+        """Items grouped by type"""
+        return self._grouped('type')
+
+    @property
+    def items_by_assignee(self) -> dict[Optional[str], tuple[Item, ...]]:
+        """Items grouped by assignee (None for unassigned)"""
+        return self._grouped('assigned_to')
+
+    @property
+    def items_by_workstream(self) -> dict[Optional[str], tuple[Item, ...]]:
+        """Items grouped by workstream (None for no workstream)"""
+        return self._grouped('workstream')
+
+    @property
+    def open_items(self) -> tuple[Item, ...]:
+        """All non-completed items"""
+        return self._cached('open_items', lambda: tuple(i for i in self.items if i.is_open))
+
+    @property
+    def critical_items(self) -> tuple[Item, ...]:
+        """All items with critical status"""
+        return self._cached('critical_items', lambda: tuple(i for i in self.items if i.is_critical))
 
     def get_item(self, item_num: int) -> Optional[Item]:
         """Get item by number"""
-        for item in self.items:
-            if item.item_num == item_num:
-                return item
-        return None
+        return self.items_by_num.get(item_num)
 
     def get_open_items(self) -> list[Item]:
-        """Get all non-completed items"""
-        return [i for i in self.items if i.is_open]
+        """Get all non-completed items (copy of the cached open_items view)"""
+        return list(self.open_items)
 
     def get_items_by_type(self, item_type: str) -> list[Item]:
         """Get items filtered by type"""
-        return [i for i in self.items if i.type == item_type]
+        return list(self.items_by_type.get(item_type, ()))
 
     def get_items_by_assignee(self, assignee: str) -> list[Item]:
         """Get items assigned to a specific person"""
-        return [i for i in self.items if i.assigned_to == assignee]
+        return list(self.items_by_assignee.get(assignee, ()))
 
     def get_items_by_workstream(self, workstream: str) -> list[Item]:
         """Get items in a specific workstream"""
-        return [i for i in self.items if i.workstream == workstream]
+        return list(self.items_by_workstream.get(workstream, ()))
@@ -3,7 +3,9 @@ Platform-aware path handling for BRAID Manager.
 Provides consistent data directory locations across macOS and Windows.
 """
 
+import os
 import sys
+from functools import cache
 from pathlib import Path
 
 
@@ -20,14 +22,26 @@ def get_app_data_dir() -> Path:
         macOS:   ~/Library/Application Support/BRAID Manager/
         Windows: %APPDATA%/BRAID Manager/  (typically C:/Users/<user>/AppData/Roaming/)
         Linux:   ~/.local/share/BRAID Manager/
+
+    Resolved once per platform/environment combination; the cache key holds
+    every input so patching sys.platform or the env still takes effect.
     """
-    if sys.platform == "darwin":
+    return _app_data_dir(
+        sys.platform,
+        os.environ.get("APPDATA"),
+        os.environ.get("HOME"),
+        os.environ.get("USERPROFILE"),
+    )
+
+
+@cache
+def _app_data_dir(platform: str, appdata, home, userprofile) -> Path:
+    """Resolve the app data directory (home/userprofile only feed Path.home())"""
+    if platform == "darwin":
         # macOS
         base = Path.home() / "Library" / "Application Support"
-    elif sys.platform == "win32":
+    elif platform == "win32":
         # Windows - use APPDATA environment variable
-        import os
-        appdata = os.environ.get("APPDATA")
         if appdata:
             base = Path(appdata)
         else:
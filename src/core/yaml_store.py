@@ -3,10 +3,15 @@ YAML persistence layer for RAID Manager.
 Handles loading and saving RAID logs and Budget files.
 """
 
+import os
+import re
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from datetime import date, datetime
-from typing import Optional, Any
+from typing import Iterable, Optional, Any
 
 from .models import (
     Item, ProjectData, ProjectMetadata,
@@ -14,6 +19,52 @@ from .models import (
 )
 
 
+# libyaml-backed safe loader/dumper when PyYAML was built with it, else pure Python
+_Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Block style, UTF-8 as-is, and keys in the order the save methods build them
+# (no per-mapping sort pass)
+_DUMP_OPTIONS = {
+    'Dumper': _Dumper,
+    'default_flow_style': False,
+    'allow_unicode': True,
+    'sort_keys': False,
+}
+
+# Last few parsed documents by absolute path. An entry is reused only when
+# the file's bytes match what was parsed, so edits are seen whatever the
+# filesystem's mtime resolution. Only raw YAML is kept; every load builds
+# fresh dataclasses.
+_RAW_CACHE_SIZE = 8
+_raw_cache: dict[str, tuple[bytes, Any]] = {}
+
+
+def _load_yaml(filepath: Path) -> Any:
+    """Parse a YAML file, reusing the last parse if its contents are unchanged"""
+    key = os.path.abspath(filepath)
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    cached = _raw_cache.pop(key, None)
+    if cached is not None and cached[0] == data:
+        raw = cached[1]
+    else:
+        # Bytes, not str: libyaml decodes them itself (UTF-8/16, BOM aware)
+        raw = yaml.load(data, Loader=_Loader)
+    # Re-insert as most recent, then drop the oldest beyond the bound
+    _raw_cache[key] = (data, raw)
+    while len(_raw_cache) > _RAW_CACHE_SIZE:
+        del _raw_cache[next(iter(_raw_cache))]
+    return raw
+
+
+def _dump_yaml(filepath: Path, output: dict) -> None:
+    """Write a YAML file and drop any cached parse of it"""
+    _raw_cache.pop(os.path.abspath(filepath), None)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        yaml.dump(output, f, **_DUMP_OPTIONS)
+
+
 def _parse_date(value: Any) -> Optional[date]:
     """Parse a date from various formats"""
     if value is None:
@@ -23,13 +74,29 @@ def _parse_date(value: Any) -> Optional[date]:
     if isinstance(value, datetime):
         return value.date()
     if isinstance(value, str):
-        try:
-            return datetime.strptime(value, '%Y-%m-%d').date()
-        except ValueError:
-            return None
+        return _parse_date_str(value)
     return None
 
 
+# Items in a project share a small set of dates, so most lookups are repeats
+@lru_cache(maxsize=1024)
+def _parse_date_str(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, None if it isn't one"""
+    # Fast path for canonical YYYY-MM-DD. fromisoformat also takes forms
+    # strptime rejects (e.g. 20241215, 2024-W50-1), so only trust it when
+    # it round-trips; anything else gets the old strptime treatment.
+    try:
+        parsed = date.fromisoformat(value)
+        if parsed.isoformat() == value:
+            return parsed
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
 def _format_date(d: Optional[date]) -> Optional[str]:
     """Format date as YAML string"""
     if d is None:
@@ -40,6 +107,14 @@ def _format_date(d: Optional[date]) -> Optional[str]:
 class YamlStore:
     """Handles YAML file operations for RAID and Budget data"""
 
+    # Discovery filename patterns (same matches as the old RAID-Log-*.yaml,
+    # BRAID-Log-*.yaml and Budget-*.yaml globs). Like Path.glob and
+    # WindowsPath ordering, matching and sorting ignore case on Windows.
+    _NAME_FLAGS = re.IGNORECASE if os.name == 'nt' else 0
+    _NAME_SORT_KEY = str.lower if os.name == 'nt' else None
+    _RAID_RE = re.compile(r'B?RAID-Log-.*\.yaml\Z', _NAME_FLAGS)
+    _BUDGET_RE = re.compile(r'Budget-.*\.yaml\Z', _NAME_FLAGS)
+
     def __init__(self, data_dir: Optional[Path] = None):
         self.data_dir = data_dir or Path('.')
 
@@ -49,8 +124,7 @@ class YamlStore:
 
     def load_raid_log(self, filepath: Path) -> ProjectData:
         """Load a RAID log from YAML file"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            raw = yaml.safe_load(f)
+        raw = _load_yaml(filepath)
 
         # Parse metadata
         meta_raw = raw.get('metadata', {})
@@ -62,17 +136,14 @@ class YamlStore:
             project_start=_parse_date(meta_raw.get('project_start')),
             project_end=_parse_date(meta_raw.get('project_end')),
             indicators_updated=_parse_date(meta_raw.get('indicators_updated')),
-            workstreams=meta_raw.get('workstreams', [])
+            workstreams=list(meta_raw.get('workstreams') or [])
         )
 
         # Parse items
         items = []
         for item_raw in raw.get('items', []):
-            # Handle dep_item_num which might be strings or ints
-            deps = item_raw.get('dep_item_num', [])
-            if deps is None:
-                deps = []
-            deps = [int(d) if isinstance(d, str) else d for d in deps]
+            # dep_item_num is saved as strings but may be hand-edited to ints
+            deps = list(map(int, item_raw.get('dep_item_num') or ()))
 
             item = Item(
                 item_num=item_raw.get('item_num', 0),
@@ -89,7 +160,7 @@ class YamlStore:
                 draft=item_raw.get('draft', False),
                 client_visible=item_raw.get('client_visible', True),
                 percent_complete=item_raw.get('percent_complete', 0),
-                rpt_out=item_raw.get('rpt_out', []) or [],
+                rpt_out=list(item_raw.get('rpt_out') or []),
                 created_date=_parse_date(item_raw.get('created_date')),
                 last_updated=_parse_date(item_raw.get('last_updated')),
                 notes=item_raw.get('notes'),
@@ -112,7 +183,7 @@ class YamlStore:
             'project_start': _format_date(data.metadata.project_start),
             'project_end': _format_date(data.metadata.project_end),
             'indicators_updated': _format_date(data.metadata.indicators_updated),
-            'workstreams': data.metadata.workstreams
+            'workstreams': list(data.metadata.workstreams)
         }
 
         # Build items list
@@ -132,7 +203,7 @@ class YamlStore:
                 'draft': item.draft,
                 'client_visible': item.client_visible,
                 'percent_complete': item.percent_complete,
-                'rpt_out': item.rpt_out or [],
+                'rpt_out': list(item.rpt_out or ()),
                 'created_date': _format_date(item.created_date),
                 'last_updated': _format_date(item.last_updated),
                 'notes': item.notes,
@@ -153,8 +224,7 @@ class YamlStore:
             'items': items_list
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(output, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        _dump_yaml(filepath, output)
 
     # -------------------------------------------------------------------------
     # Budget Operations
@@ -162,8 +232,7 @@ class YamlStore:
 
     def load_budget(self, filepath: Path) -> BudgetData:
         """Load a Budget file from YAML"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            raw = yaml.safe_load(f)
+        raw = _load_yaml(filepath)
 
         # Parse metadata
         meta_raw = raw.get('metadata', {})
@@ -177,35 +246,38 @@ class YamlStore:
         )
 
         # Parse rate card
-        rate_card = []
-        for rc_raw in raw.get('rate_card', []):
-            rate_card.append(RateCardEntry(
+        rate_card = [
+            RateCardEntry(
                 name=rc_raw.get('name', ''),
                 geography=rc_raw.get('geography', ''),
                 rate=float(rc_raw.get('rate', 0)),
                 roll_off_date=_parse_date(rc_raw.get('roll_off_date'))
-            ))
+            )
+            for rc_raw in raw.get('rate_card', [])
+        ]
 
         # Parse budget ledger
-        budget_ledger = []
-        for bl_raw in raw.get('budget_ledger', []):
-            budget_ledger.append(BudgetLedgerEntry(
+        budget_ledger = [
+            BudgetLedgerEntry(
                 amount=float(bl_raw.get('amount', 0)),
                 date=_parse_date(bl_raw.get('date')) or date.today(),
                 note=bl_raw.get('note')
-            ))
+            )
+            for bl_raw in raw.get('budget_ledger', [])
+        ]
 
         # Parse timesheet data
-        timesheet_data = []
-        for ts_raw in raw.get('timesheet_data', []):
-            timesheet_data.append(TimesheetEntry(
+        timesheet_data = [
+            TimesheetEntry(
                 week_ending=_parse_date(ts_raw.get('week_ending')) or date.today(),
                 resource=ts_raw.get('resource', ''),
                 hours=float(ts_raw.get('hours', 0)),
                 rate=float(ts_raw.get('rate', 0)),
                 cost=float(ts_raw.get('cost', 0)),
                 complete_week=ts_raw.get('complete_week', True)
-            ))
+            )
+            for ts_raw in raw.get('timesheet_data', [])
+        ]
 
         return BudgetData(
             metadata=metadata,
@@ -225,33 +297,36 @@ class YamlStore:
             'data_source': data.metadata.data_source
         }
 
-        rate_card_list = []
-        for rc in data.rate_card:
-            rate_card_list.append({
+        rate_card_list = [
+            {
                 'name': rc.name,
                 'geography': rc.geography,
                 'rate': rc.rate,
                 'roll_off_date': _format_date(rc.roll_off_date)
-            })
+            }
+            for rc in data.rate_card
+        ]
 
-        budget_ledger_list = []
-        for bl in data.budget_ledger:
-            budget_ledger_list.append({
+        budget_ledger_list = [
+            {
                 'amount': bl.amount,
                 'date': _format_date(bl.date),
                 'note': bl.note
-            })
+            }
+            for bl in data.budget_ledger
+        ]
 
-        timesheet_list = []
-        for ts in data.timesheet_data:
-            timesheet_list.append({
+        timesheet_list = [
+            {
                 'week_ending': _format_date(ts.week_ending),
                 'resource': ts.resource,
                 'hours': ts.hours,
                 'rate': ts.rate,
                 'cost': ts.cost,
                 'complete_week': ts.complete_week
-            })
+            }
+            for ts in data.timesheet_data
+        ]
 
         output = {
             'metadata': meta_dict,
@@ -260,21 +335,46 @@ class YamlStore:
             'timesheet_data': timesheet_list
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.dump(output, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        _dump_yaml(filepath, output)
 
     # -------------------------------------------------------------------------
     # Discovery
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    def _scan(directory: Path, pattern: re.Pattern) -> list[Path]:
+        """Files in directory whose names match pattern, sorted"""
+        try:
+            with os.scandir(directory) as entries:
+                names = [e.name for e in entries
+                         if pattern.match(e.name) and e.is_file()]
+        except OSError:
+            # Missing, not a directory or unreadable (as Path.glob tolerated)
+            return []
+        # Same parent, so sorting names orders the paths; strings sort cheaper
+        names.sort(key=YamlStore._NAME_SORT_KEY)
+        return [directory / name for name in names]
+
     def find_raid_logs(self) -> list[Path]:
         """Find all RAID/BRAID log files in data directory"""
-        patterns = ['RAID-Log-*.yaml', 'BRAID-Log-*.yaml']
-        files = []
-        for pattern in patterns:
-            files.extend(self.data_dir.glob(pattern))
-        return sorted(files)
+        return self._scan(self.data_dir, self._RAID_RE)
+
+    def find_raid_logs_in(self, dirs: Iterable[Path]) -> list[Path]:
+        """Find RAID/BRAID log files across several directories
+
+        Results follow the order of dirs, each directory's files sorted;
+        missing or unreadable directories are skipped. Directories are scanned on worker
+        threads (scandir releases the GIL), which pays off on network or
+        synced folders.
+        """
+        dirs = list(dirs)
+        if len(dirs) < 2:
+            return [f for d in dirs for f in self._scan(d, self._RAID_RE)]
+        with ThreadPoolExecutor(max_workers=min(8, len(dirs))) as ex:
+            return list(chain.from_iterable(
+                ex.map(self._scan, dirs, [self._RAID_RE] * len(dirs))
+            ))
 
     def find_budget_files(self) -> list[Path]:
         """Find all Budget files in data directory"""
-        return sorted(self.data_dir.glob('Budget-*.yaml'))
+        return self._scan(self.data_dir, self._BUDGET_RE)
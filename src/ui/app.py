@@ -264,6 +264,7 @@ class RAIDManagerApp(ctk.CTk):
         today = date.today()
 
         update_all_indicators(self.project_data.items, today)
+        self.project_data.touch()
         self.project_data.metadata.indicators_updated = today
         self.project_data.metadata.last_updated = today
 
@@ -574,7 +574,7 @@ class DashboardView(ctk.CTkScrollableFrame):
         # Outer radius 0.85, inner radius 0.60 gives stroke-width equivalent
         wedges, _ = ax.pie(
             sizes, colors=chart_colors, startangle=90,
-            wedgeprops=dict(width=0.28, edgecolor=bg_color, linewidth=1.5),
+            wedgeprops={'width': 0.28, 'edgecolor': bg_color, 'linewidth': 1.5},
             radius=0.88
         )
 
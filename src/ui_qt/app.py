@@ -339,6 +339,7 @@ class RAIDManagerApp(QMainWindow):
         today = date.today()
 
         update_all_indicators(self.project_data.items, today)
+        self.project_data.touch()
         self.project_data.metadata.indicators_updated = today
         self.project_data.metadata.last_updated = today
 
@@ -435,6 +436,9 @@ class RAIDManagerApp(QMainWindow):
         if not self.project_data or not self.data_dir:
             return
 
+        # Item was edited in place - rebuild cached item views
+        self.project_data.touch()
+
         # Update project metadata
         from datetime import date
         self.project_data.metadata.last_updated = date.today()
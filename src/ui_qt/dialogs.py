@@ -505,7 +505,11 @@ class EditItemDialog(QDialog):
             self.notes_edit.setFocus()
 
     def _save_item(self):
-        """Save changes to the item"""
+        """Save changes to the item
+
+        Edits self.item in place; the item_saved handler must touch() the
+        ProjectData so its cached views rebuild.
+        """
         # Update item with field values
         self.item.title = self.title_edit.text().strip()
         self.item.type = self.type_combo.currentText()
@@ -219,8 +219,8 @@ def extract_chronology(project_data: ProjectData) -> List[dict]:
         notes = item.notes or ''
         entries = parse_notes(notes)
 
-        for entry in entries:
-            chronology.append({
+        chronology.extend(
+            {
                 'date': entry['date'],
                 'author': entry['author'],
                 'note_text': entry['text'],
@@ -232,7 +232,9 @@ def extract_chronology(project_data: ProjectData) -> List[dict]:
                 'assigned_to': item.assigned_to or '',
                 'indicator': item.indicator or 'Not Started',
                 'percent_complete': item.percent_complete or 0,
-            })
+            }
+            for entry in entries
+        )
 
     # Sort by date descending (most recent first)
     chronology.sort(key=lambda x: x['date'], reverse=True)
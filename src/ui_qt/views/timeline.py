@@ -16,6 +16,53 @@ from src.core.models import ProjectData
 from src.ui_qt.styles import INDICATOR_COLORS, INDICATOR_SEVERITY
 
 
+def _indicator_entry(severity, hex_color):
+    """Build a (severity, bar color, translucent bar color) table entry"""
+    color = QColor(hex_color)
+    return (severity, color, QColor(color.red(), color.green(), color.blue(), 80))
+
+
+# Per-indicator severity and bar colors, built once so the filter and paint
+# loops do a single lookup per item instead of re-creating QColors
+_INDICATOR_TABLE = {
+    indicator: _indicator_entry(INDICATOR_SEVERITY.get(indicator, ""), INDICATOR_COLORS.get(indicator, "#6c757d"))
+    for indicator in INDICATOR_COLORS.keys() | INDICATOR_SEVERITY.keys()
+}
+_DEFAULT_INDICATOR_ENTRY = _indicator_entry("", "#6c757d")
+
+# Indicators hidden by the default "All Active" status filter
+_INACTIVE_INDICATORS = frozenset([
+    "Draft", "Completed", "Completed Recently", "Done", "Closed", "Cancelled", "Resolved"
+])
+
+# Severities shown by the severity-based status filters
+_STATUS_SEVERITIES = {
+    "critical": ("critical",),
+    "warning": ("warning",),
+    "in_progress": ("active", "upcoming"),
+}
+
+
+def _status_filter(filter_status):
+    """Return an indicator predicate for a status filter, or None to keep everything"""
+    if filter_status == "all":
+        # Show everything including Draft
+        return None
+    if filter_status == "all_open":
+        # Show everything except Draft (includes Completed)
+        return lambda indicator: indicator != "Draft"
+    severities = _STATUS_SEVERITIES.get(filter_status)
+    if severities:
+        return lambda indicator: _INDICATOR_TABLE.get(indicator, _DEFAULT_INDICATOR_ENTRY)[0] in severities
+    # Default: All Active - exclude Draft and Completed
+    return lambda indicator: indicator not in _INACTIVE_INDICATORS
+
+
+def _real_date(value):
+    """Return value if it is a date, None for blanks and unparsed strings"""
+    return value if value and not isinstance(value, str) else None
+
+
 def add_shadow(widget, blur=15, offset=2, color=QColor(0, 0, 0, 25)):
     """Add drop shadow to a widget"""
     shadow = QGraphicsDropShadowEffect()
@@ -25,6 +72,22 @@ def add_shadow(widget, blur=15, offset=2, color=QColor(0, 0, 0, 25)):
     widget.setGraphicsEffect(shadow)
 
 
+def _last_note_line(notes_text):
+    """Find the last '>'-prefixed line in notes, scanning back from the end.
+
+    Only the most recent note is needed, so walk lines from the tail with
+    rfind instead of splitting the whole notes string.
+    """
+    end = len(notes_text)
+    while end >= 0:
+        start = notes_text.rfind('\n', 0, end) + 1
+        line = notes_text[start:end].strip()
+        if line.startswith('>'):
+            return line
+        end = start - 1
+    return None
+
+
 class TimelineChart(QWidget):
     """Custom timeline/Gantt chart widget"""
 
@@ -33,15 +96,25 @@ class TimelineChart(QWidget):
 
     def __init__(self, items, parent=None):
         super().__init__(parent)
-        self.items = items
+        self.items = []
         self.row_height = 32
         self.header_height = 40
         self.left_margin = 250
         self.right_margin = 20
 
+        # Rounded bar paths keyed by (width, height); bars are drawn at the
+        # origin and translated into place, so equal-width bars share a path
+        self._bar_path_cache = {}
+
         # Enable mouse tracking for tooltips
         self.setMouseTracking(True)
 
+        self.set_items(items)
+
+    def set_items(self, items):
+        """Show a new set of items, reusing this widget instead of rebuilding it"""
+        self.items = items
+
         # Calculate date range
         self._calculate_date_range()
 
@@ -49,6 +122,8 @@ class TimelineChart(QWidget):
         min_height = self.header_height + len(self.items) * self.row_height + 20
         self.setMinimumHeight(max(400, min_height))
 
+        self.update()
+
     def mouseMoveEvent(self, event):
         """Show tooltip on hover and update cursor"""
         y = event.pos().y()
@@ -68,6 +143,11 @@ class TimelineChart(QWidget):
             self.setToolTip("")
             self.setCursor(Qt.ArrowCursor)
 
+    def resizeEvent(self, event):
+        """Drop cached bar paths - bar widths change with the widget width"""
+        self._bar_path_cache.clear()
+        super().resizeEvent(event)
+
     def leaveEvent(self, event):
         """Reset cursor when leaving widget"""
         self.setCursor(Qt.ArrowCursor)
@@ -128,10 +208,9 @@ class TimelineChart(QWidget):
 
         # Add last note (notes format: "> DATE - AUTHOR - TEXT")
         if item.get('notes'):
-            notes_text = item['notes']
-            note_lines = [n.strip() for n in notes_text.split('\n') if n.strip().startswith('>')]
-            if note_lines:
-                last_note = note_lines[-1].lstrip('> ').strip()
+            last_line = _last_note_line(item['notes'])
+            if last_line:
+                last_note = last_line.lstrip('> ').strip()
                 if len(last_note) > 80:
                     last_note = last_note[:77] + "..."
                 lines.append(f"---")
@@ -164,6 +243,16 @@ class TimelineChart(QWidget):
         available_width = self.width() - self.left_margin - self.right_margin
         return self.left_margin + int((days_from_start / self.total_days) * available_width)
 
+    def _bar_path(self, width, height):
+        """Get a rounded-rect bar path anchored at (0, 0), cached by size"""
+        key = (width, height)
+        path = self._bar_path_cache.get(key)
+        if path is None:
+            path = QPainterPath()
+            path.addRoundedRect(0, 0, width, height, 4, 4)
+            self._bar_path_cache[key] = path
+        return path
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
@@ -209,11 +298,18 @@ class TimelineChart(QWidget):
         painter.setFont(font)
         painter.setPen(QColor("#999999"))
 
+        # Skip week ticks when zoomed out far enough that they'd overdraw
+        # each other, and drop the day numbers before they start overlapping
+        available_width = w - self.left_margin - self.right_margin
+        px_per_week = 7 * available_width / self.total_days
+        draw_weeks = px_per_week >= 3
+        draw_day_numbers = px_per_week >= 20
+
         # Find first Sunday on or after start_date
         days_until_sunday = (6 - self.start_date.weekday()) % 7
         current_week = self.start_date + timedelta(days=days_until_sunday)
 
-        while current_week <= self.end_date:
+        while draw_weeks and current_week <= self.end_date:
             x = self._date_to_x(current_week)
             if x and self.left_margin <= x <= w - self.right_margin:
                 # Draw small tick mark
@@ -221,9 +317,10 @@ class TimelineChart(QWidget):
                 painter.drawLine(x, self.header_height - 8, x, self.header_height)
 
                 # Draw day number
-                painter.setPen(QColor("#999999"))
-                day_str = str(current_week.day)
-                painter.drawText(x - 4, self.header_height - 10, day_str)
+                if draw_day_numbers:
+                    painter.setPen(QColor("#999999"))
+                    day_str = str(current_week.day)
+                    painter.drawText(x - 4, self.header_height - 10, day_str)
 
                 # Light vertical guideline
                 painter.setPen(QPen(QColor("#f0f0f0"), 1))
@@ -266,7 +363,7 @@ class TimelineChart(QWidget):
 
             # Draw bar - use indicator color (status-based, like HTML version)
             indicator = item.get('indicator', 'Not Started')
-            color = QColor(INDICATOR_COLORS.get(indicator, "#6c757d"))
+            _, color, translucent = _INDICATOR_TABLE.get(indicator, _DEFAULT_INDICATOR_ENTRY)
 
             start_x = self._date_to_x(item.get('start'))
             end_x = self._date_to_x(item.get('end') or item.get('deadline'))
@@ -276,26 +373,26 @@ class TimelineChart(QWidget):
                 bar_y = y + 4
                 bar_h = self.row_height - 16
 
-                path = QPainterPath()
-                path.addRoundedRect(start_x, bar_y, end_x - start_x, bar_h, 4, 4)
+                # Paths are cached at the origin - translate into place
+                path = self._bar_path(end_x - start_x, bar_h)
+                painter.translate(start_x, bar_y)
 
                 # Fill based on completion
                 pct = item.get('pct', 0) / 100
                 if pct > 0:
                     # Completed portion (solid)
                     completed_width = int((end_x - start_x) * pct)
-                    painter.fillPath(path, QColor(color.red(), color.green(), color.blue(), 80))
+                    painter.fillPath(path, translucent)
 
                     if completed_width > 0:
-                        completed_path = QPainterPath()
-                        completed_path.addRoundedRect(start_x, bar_y, completed_width, bar_h, 4, 4)
-                        painter.fillPath(completed_path, color)
+                        painter.fillPath(self._bar_path(completed_width, bar_h), color)
                 else:
-                    painter.fillPath(path, QColor(color.red(), color.green(), color.blue(), 80))
+                    painter.fillPath(path, translucent)
 
                 # Border
                 painter.setPen(QPen(color, 1))
                 painter.drawPath(path)
+                painter.translate(-start_x, -bar_y)
 
             elif item.get('deadline'):
                 # Just a deadline marker (diamond)
@@ -348,8 +445,9 @@ class TimelineView(QScrollArea):
         self.filter_status = ""  # Default: All Active
         self.sort_by = "start"
 
-        # Reference to chart card for easy replacement
+        # Chart card - kept for the life of the view, only its contents change
         self.chart_card = None
+        self.chart = None
 
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
@@ -527,9 +625,9 @@ class TimelineView(QScrollArea):
 
         # Use pre-built timeline data
         if timeline_items:
-            chart = TimelineChart(timeline_items)
-            chart.item_clicked.connect(self.item_clicked.emit)
-            card_layout.addWidget(chart)
+            self.chart = TimelineChart(timeline_items)
+            self.chart.item_clicked.connect(self.item_clicked.emit)
+            card_layout.addWidget(self.chart)
         else:
             no_data = QLabel("No items with dates to display")
             no_data.setStyleSheet("font-size: 14px; color: #666; padding: 40px; background: transparent;")
@@ -572,93 +670,70 @@ class TimelineView(QScrollArea):
 
     def _rebuild_chart(self):
         """Rebuild the chart with current filters"""
-        # Remove the old chart card using stored reference
-        if self.chart_card:
-            self.main_layout.removeWidget(self.chart_card)
-            self.chart_card.deleteLater()
-
         # Build new timeline data
         timeline_items = self._build_timeline_items()
 
         # Update title count
         self.title_label.setText(f"Timeline ({len(timeline_items)} items)")
 
-        # Create new chart card
-        self.chart_card = QFrame()
-        self.chart_card.setStyleSheet("QFrame { background: white; border-radius: 8px; }")
-        add_shadow(self.chart_card)
+        # Existing chart just takes the new items and repaints
+        if timeline_items and self.chart is not None:
+            self.chart.set_items(timeline_items)
+            return
 
-        card_layout = QVBoxLayout(self.chart_card)
-        card_layout.setContentsMargins(0, 0, 0, 0)
+        # Swap out the card contents only - the card and its drop shadow
+        # effect are long-lived, so filter changes don't re-create the effect
+        card_layout = self.chart_card.layout()
+        while card_layout.count():
+            child = card_layout.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+        self.chart = None
 
         if timeline_items:
-            chart = TimelineChart(timeline_items)
-            chart.item_clicked.connect(self.item_clicked.emit)
-            card_layout.addWidget(chart)
+            self.chart = TimelineChart(timeline_items)
+            self.chart.item_clicked.connect(self.item_clicked.emit)
+            card_layout.addWidget(self.chart)
         else:
             no_data = QLabel("No items match the current filters")
             no_data.setStyleSheet("font-size: 14px; color: #666; padding: 40px; background: transparent;")
             no_data.setAlignment(Qt.AlignCenter)
             card_layout.addWidget(no_data)
 
-        # Insert before the stretch
-        self.main_layout.insertWidget(self.main_layout.count() - 1, self.chart_card)
-
     def _build_timeline_items(self):
         """Build list of items with date info for timeline, applying filters"""
         if not self.project_data:
             return []
 
         items = []
-        completed_indicators = ["Completed", "Completed Recently", "Done", "Closed", "Cancelled", "Resolved"]
+
+        # Resolve the filters once, outside the per-item loop
+        status_ok = _status_filter(self.filter_status)
+        filter_type = self.filter_type
+        filter_assigned = self.filter_assigned
+        filter_workstream = self.filter_workstream
 
         for item in self.project_data.items:
             # Status filter logic
-            if self.filter_status == "all":
-                # Show everything including Draft
-                pass
-            elif self.filter_status == "all_open":
-                # Show everything except Draft (includes Completed)
-                if item.indicator == "Draft":
-                    continue
-            elif self.filter_status == "critical":
-                severity = INDICATOR_SEVERITY.get(item.indicator, "")
-                if severity != "critical":
-                    continue
-            elif self.filter_status == "warning":
-                severity = INDICATOR_SEVERITY.get(item.indicator, "")
-                if severity != "warning":
-                    continue
-            elif self.filter_status == "in_progress":
-                severity = INDICATOR_SEVERITY.get(item.indicator, "")
-                if severity not in ("active", "upcoming"):
-                    continue
-            else:
-                # Default: All Active - exclude Draft and Completed
-                if item.indicator in ["Draft"] + completed_indicators:
-                    continue
+            if status_ok and not status_ok(item.indicator):
+                continue
 
             # Apply type filter
-            if self.filter_type and item.type != self.filter_type:
+            if filter_type and item.type != filter_type:
                 continue
 
             # Apply assigned filter
-            if self.filter_assigned and item.assigned_to != self.filter_assigned:
+            if filter_assigned and item.assigned_to != filter_assigned:
                 continue
 
             # Apply workstream filter
-            if self.filter_workstream and item.workstream != self.filter_workstream:
+            if filter_workstream and item.workstream != filter_workstream:
                 continue
 
             # Must have EITHER start+finish dates (for bar) OR deadline/start (for milestone)
-            has_bar_dates = (
-                (item.start and not isinstance(item.start, str)) and
-                (item.finish and not isinstance(item.finish, str))
-            )
-            has_deadline = item.deadline and not isinstance(item.deadline, str)
-            has_start_only = item.start and not isinstance(item.start, str)
-
-            if not has_bar_dates and not has_deadline and not has_start_only:
+            start = _real_date(item.start)
+            deadline = _real_date(item.deadline)
+            if not start and not deadline:
                 continue
 
             timeline_item = {
@@ -668,9 +743,9 @@ class TimelineView(QScrollArea):
                 'indicator': item.indicator or "Not Started",
                 'assigned': item.assigned_to or "",
                 'workstream': item.workstream or "",
-                'start': item.start if item.start and not isinstance(item.start, str) else None,
-                'end': item.finish if item.finish and not isinstance(item.finish, str) else None,
-                'deadline': item.deadline if item.deadline and not isinstance(item.deadline, str) else None,
+                'start': start,
+                'end': _real_date(item.finish),
+                'deadline': deadline,
                 'pct': item.percent_complete or 0,
                 'description': item.description or "",
                 'notes': item.notes or "",
@@ -692,21 +767,27 @@ class TimelineView(QScrollArea):
         """Refresh with new data"""
         self.project_data = project_data
 
-        # Clear and rebuild
-        while self.main_layout.count():
-            child = self.main_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self._clear_layout(child.layout())
-
-        self._build_ui()
-
-    def _clear_layout(self, layout):
-        """Recursively clear a layout"""
-        while layout.count():
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-            elif child.layout():
-                self._clear_layout(child.layout())
+        # Keep the title, filter card and legend - only the filter choices
+        # and the chart change. Updates are held off so it repaints once.
+        self.container.setUpdatesEnabled(False)
+        try:
+            types, assigned_list, workstreams = self._get_filter_options()
+            self._repopulate_combo(self.type_combo, types)
+            self._repopulate_combo(self.assigned_combo, assigned_list)
+            self._repopulate_combo(self.workstream_combo, workstreams)
+
+            # Re-read filter values (a selection may no longer exist) and rebuild the chart
+            self._on_filter_changed()
+        finally:
+            self.container.setUpdatesEnabled(True)
+
+    def _repopulate_combo(self, combo, values):
+        """Replace a filter combo's options, keeping the current selection if still present"""
+        current = combo.currentData() or ""
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItem("All", "")
+        for value in values:
+            combo.addItem(value, value)
+        combo.setCurrentIndex(max(combo.findData(current), 0))
+        combo.blockSignals(False)
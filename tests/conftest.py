@@ -22,16 +22,31 @@ Pytest configuration and shared fixtures for BRAID Manager tests.
 # Integration Tests (integration_*.py):
 #   - Test with real YAML files from project_viewer/data/
 #   - Not run by default pytest discovery (different naming pattern)
-#   - Run manually: python tests/integration_test_core.py
+#   - Marked "integration", which pytest.ini deselects by default
+#   - Run manually: python -m pytest tests/integration_test_core.py -m integration
+#   - Everything: python -m pytest tests/test_*.py tests/integration_test_core.py -m ""
 #
 # Running Tests:
 #   cd raid_manager
 #   .venv/bin/python -m pytest tests/ -v      # All unit tests
 #   .venv/bin/python -m pytest tests/ -v -k "indicators"  # Specific module
+#   .venv/bin/python -m pytest tests/ -n auto --dist=loadscope  # Parallel (pytest-xdist)
+#   .venv/bin/python -m pytest tests/ -n auto --dist=loadfile   # Parallel, one file per worker
+#
+# Parallel runs: --dist=loadscope keeps each module/class on one worker so
+# its module- and session-scoped fixtures are built once per worker;
+# --dist=loadfile goes further and gives each worker whole files. Shared
+# fixtures are read-only, file-writing tests use their own tmp_path, and
+# monkeypatch (sys.platform, env vars in test_paths.py) only touches the
+# worker process it runs in, so the suite is safe to split either way.
+# Not on by default in pytest.ini - the unit suite runs in well under a
+# second, less than xdist's worker startup (2 workers: ~2.1s vs ~0.7s serial).
 #
 # =============================================================================
 """
 
+import copy
+import socket
 import sys
 from pathlib import Path
 from datetime import date, timedelta
@@ -41,38 +56,64 @@ import pytest
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.core.models import Item, ProjectData, ProjectMetadata
+from src.core.models import ProjectData, ProjectMetadata
+from tests import helpers
+
+
+# =============================================================================
+# Sandbox - no real home directory, no network
+# =============================================================================
+
+def _network_disabled(*args, **kwargs):
+    raise RuntimeError("network access is disabled in tests")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _sandbox(tmp_path_factory):
+    """Point HOME at a temp dir and block sockets for the whole session.
+
+    Anything that resolves ~ (e.g. get_app_data_dir) lands under tmp, so no
+    test can write to the real app data directory.
+    """
+    home = tmp_path_factory.mktemp("home")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("HOME", str(home))
+        mp.setenv("USERPROFILE", str(home))
+        mp.setattr(socket.socket, "connect", _network_disabled)
+        mp.setattr(socket.socket, "connect_ex", _network_disabled)
+        mp.setattr(socket, "getaddrinfo", _network_disabled)
+        yield home
 
 
 # =============================================================================
 # Date Fixtures - Fixed dates for deterministic testing
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def today():
     """Fixed 'today' date for deterministic tests."""
     return date(2024, 12, 15)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def two_weeks_ago(today):
     """Date 14 days before 'today'."""
     return today - timedelta(days=14)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def one_week_ago(today):
     """Date 7 days before 'today'."""
     return today - timedelta(days=7)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def one_week_ahead(today):
     """Date 7 days after 'today'."""
     return today + timedelta(days=7)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def three_weeks_ahead(today):
     """Date 21 days after 'today'."""
     return today + timedelta(days=21)
@@ -82,34 +123,19 @@ def three_weeks_ahead(today):
 # Item Factory Fixture
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def make_item():
-    """Factory fixture to create test items with defaults."""
-    def _make_item(
-        item_num=1,
-        type="Action Item",
-        title="Test Item",
-        percent_complete=0,
-        start=None,
-        finish=None,
-        deadline=None,
-        duration=None,
-        draft=False,
-        **kwargs
-    ):
-        return Item(
-            item_num=item_num,
-            type=type,
-            title=title,
-            percent_complete=percent_complete,
-            start=start,
-            finish=finish,
-            deadline=deadline,
-            duration=duration,
-            draft=draft,
-            **kwargs
-        )
-    return _make_item
+    """Factory fixture to create test items with defaults.
+
+    Kept for existing callers - new tests import helpers.make_item directly.
+    """
+    return helpers.make_item
+
+
+@pytest.fixture
+def blank_item():
+    """Fresh minimal item (no indicator) - function-scoped, safe to mutate."""
+    return helpers.make_item(title="Test")
 
 
 # =============================================================================
@@ -118,7 +144,7 @@ def make_item():
 
 @pytest.fixture
 def sample_metadata():
-    """Sample project metadata."""
+    """Sample project metadata - fresh per test, safe to mutate."""
     return ProjectMetadata(
         project_name="Test Project",
         client_name="Test Client",
@@ -127,24 +153,34 @@ def sample_metadata():
     )
 
 
+@pytest.fixture(scope="session")
+def _sample_items_template(today, one_week_ago, one_week_ahead):
+    """Items behind sample_items, built once per session."""
+    return (
+        helpers.make_item(item_num=1, title="Completed task", percent_complete=100,
+                          start=one_week_ago, finish=today, type="Action Item"),
+        helpers.make_item(item_num=2, title="In progress task", percent_complete=50,
+                          start=one_week_ago, finish=one_week_ahead, type="Action Item"),
+        helpers.make_item(item_num=3, title="Not started task", percent_complete=0,
+                          start=today, finish=one_week_ahead, type="Risk"),
+        helpers.make_item(item_num=4, title="Late task", percent_complete=25,
+                          start=one_week_ago, finish=one_week_ago, type="Issue"),
+        helpers.make_item(item_num=5, title="Draft item", percent_complete=0, draft=True,
+                          type="Decision"),
+    )
+
+
 @pytest.fixture
-def sample_items(make_item, today, one_week_ago, one_week_ahead):
-    """Sample set of items with various states."""
-    return [
-        make_item(item_num=1, title="Completed task", percent_complete=100,
-                  start=one_week_ago, finish=today, type="Action Item"),
-        make_item(item_num=2, title="In progress task", percent_complete=50,
-                  start=one_week_ago, finish=one_week_ahead, type="Action Item"),
-        make_item(item_num=3, title="Not started task", percent_complete=0,
-                  start=today, finish=one_week_ahead, type="Risk"),
-        make_item(item_num=4, title="Late task", percent_complete=25,
-                  start=one_week_ago, finish=one_week_ago, type="Issue"),
-        make_item(item_num=5, title="Draft item", percent_complete=0, draft=True,
-                  type="Decision"),
-    ]
+def sample_items(_sample_items_template):
+    """Sample set of items with various states.
+
+    Fresh copies per test - tests set indicators on these items. Returned
+    as a tuple so the collection itself can't be changed.
+    """
+    return tuple(copy.copy(item) for item in _sample_items_template)
 
 
 @pytest.fixture
 def sample_project(sample_metadata, sample_items):
     """Sample project with metadata and items."""
-    return ProjectData(metadata=sample_metadata, items=sample_items)
+    return ProjectData.from_iter(sample_metadata, sample_items)
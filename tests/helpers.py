@@ -0,0 +1,56 @@
+"""
+Plain helper functions shared by the BRAID Manager tests.
+
+Import these directly - they are not fixtures.
+"""
+
+from src.core.budget import calculate_budget
+from src.core.models import Item
+
+# Calculated budgets keyed by id() of the BudgetData they came from. The data
+# object is stored alongside the result so its id can't be reused.
+_calc_cache = {}
+
+
+# Fields make_item sets unless overridden; built once at import
+_ITEM_DEFAULTS = {
+    "item_num": 1,
+    "type": "Action Item",
+    "title": "Test Item",
+    "percent_complete": 0,
+    "start": None,
+    "finish": None,
+    "deadline": None,
+    "duration": None,
+    "draft": False,
+}
+
+
+def make_item(**kwargs):
+    """Create a test item with defaults (see _ITEM_DEFAULTS).
+
+    Keyword arguments override the defaults or set any other Item field.
+    """
+    return Item(**{**_ITEM_DEFAULTS, **kwargs})
+
+
+def calc(data):
+    """calculate_budget() once per BudgetData object.
+
+    Only for read-only data - changes made after the first call are not seen.
+    """
+    cached = _calc_cache.get(id(data))
+    if cached is None or cached[0] is not data:
+        cached = (data, calculate_budget(data))
+        _calc_cache[id(data)] = cached
+    return cached[1]
+
+
+def assert_contains_all(haystack, needles):
+    """Assert every needle is in haystack (a string or a token set).
+
+    Reports all missing needles in one failure rather than stopping at
+    the first.
+    """
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"missing: {missing}"
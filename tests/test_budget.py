@@ -1,7 +1,7 @@
 """
 Unit tests for budget calculation logic.
 
-Tests the BudgetCalculator class and currency formatting functions.
+Tests calculate_budget (and the BudgetCalculator wrapper) and currency formatting functions.
 """
 
 import pytest
@@ -9,6 +9,8 @@ from datetime import date, timedelta
 
 from src.core.budget import (
     BudgetCalculator,
+    calculate_budget,
+    get_budget_from_raid_items,
     BudgetMetrics,
     CalculatedBudget,
     WeeklyBurn,
@@ -25,13 +27,29 @@ from src.core.models import (
     BudgetLedgerEntry,
     Item,
 )
+from tests.helpers import calc
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _ts(week, resource, rate, hours=40.0, complete=True):
+    """Timesheet entry costed at rate * hours."""
+    return TimesheetEntry(week_ending=week, resource=resource, hours=hours,
+                          rate=rate, cost=rate * hours, complete_week=complete)
+
+
+def _weeks(start, n):
+    """n consecutive week-ending dates from start."""
+    return [start + timedelta(weeks=i) for i in range(n)]
 
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_budget_data():
     """Budget data with no timesheet entries."""
     return BudgetData(
@@ -42,7 +60,7 @@ def empty_budget_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def simple_budget_data():
     """Simple budget with a few weeks of data."""
     return BudgetData(
@@ -57,18 +75,11 @@ def simple_budget_data():
         budget_ledger=[
             BudgetLedgerEntry(amount=50000.0, date=date(2024, 1, 1), note="Initial"),
         ],
-        timesheet_data=[
-            TimesheetEntry(week_ending=date(2024, 1, 7), resource="Alice",
-                          hours=40.0, rate=150.0, cost=6000.0, complete_week=True),
-            TimesheetEntry(week_ending=date(2024, 1, 14), resource="Alice",
-                          hours=40.0, rate=150.0, cost=6000.0, complete_week=True),
-            TimesheetEntry(week_ending=date(2024, 1, 21), resource="Alice",
-                          hours=40.0, rate=150.0, cost=6000.0, complete_week=True),
-        ]
+        timesheet_data=[_ts(w, "Alice", 150.0) for w in _weeks(date(2024, 1, 7), 3)]
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def multi_resource_budget_data():
     """Budget with multiple resources."""
     return BudgetData(
@@ -84,19 +95,61 @@ def multi_resource_budget_data():
         ],
         timesheet_data=[
             # Week 1
-            TimesheetEntry(week_ending=date(2024, 1, 7), resource="Alice",
-                          hours=40.0, rate=175.0, cost=7000.0, complete_week=True),
-            TimesheetEntry(week_ending=date(2024, 1, 7), resource="Bob",
-                          hours=40.0, rate=125.0, cost=5000.0, complete_week=True),
+            _ts(date(2024, 1, 7), "Alice", 175.0),
+            _ts(date(2024, 1, 7), "Bob", 125.0),
             # Week 2
-            TimesheetEntry(week_ending=date(2024, 1, 14), resource="Alice",
-                          hours=32.0, rate=175.0, cost=5600.0, complete_week=True),
-            TimesheetEntry(week_ending=date(2024, 1, 14), resource="Bob",
-                          hours=40.0, rate=125.0, cost=5000.0, complete_week=True),
+            _ts(date(2024, 1, 14), "Alice", 175.0, hours=32.0),
+            _ts(date(2024, 1, 14), "Bob", 125.0),
         ]
     )
 
 
+@pytest.fixture(scope="module")
+def simple_result(simple_budget_data):
+    """simple_budget_data calculated once for all read-only assertions."""
+    return calc(simple_budget_data)
+
+
+@pytest.fixture(scope="module")
+def multi_resource_result(multi_resource_budget_data):
+    """multi_resource_budget_data calculated once for all read-only assertions."""
+    return calc(multi_resource_budget_data)
+
+
+@pytest.fixture(scope="module")
+def resource_map(multi_resource_result):
+    """Resource burn rows of multi_resource_result keyed by resource name."""
+    return {r.resource: r for r in multi_resource_result.resource_burn}
+
+
+@pytest.fixture(scope="module")
+def budget_items_mixed():
+    """Two Budget items and a non-Budget item."""
+    return (
+        Item(item_num=1, type="Budget", title="Initial", budget_amount=50000),
+        Item(item_num=2, type="Budget", title="Extension", budget_amount=25000),
+        Item(item_num=3, type="Action Item", title="Task", budget_amount=None),
+    )
+
+
+@pytest.fixture(scope="module")
+def non_budget_items():
+    """Items with amounts but no Budget type."""
+    return (
+        Item(item_num=1, type="Risk", title="Risk", budget_amount=10000),
+        Item(item_num=2, type="Action Item", title="Task", budget_amount=5000),
+    )
+
+
+@pytest.fixture(scope="module")
+def budget_items_missing_amount():
+    """Budget items where one has no amount."""
+    return (
+        Item(item_num=1, type="Budget", title="No Amount", budget_amount=None),
+        Item(item_num=2, type="Budget", title="With Amount", budget_amount=10000),
+    )
+
+
 # =============================================================================
 # Currency Formatting Tests
 # =============================================================================
@@ -134,16 +187,29 @@ class TestFormatCurrency:
 # BudgetCalculator Tests
 # =============================================================================
 
+class TestBudgetCalculatorShim:
+    """Tests for the BudgetCalculator wrapper."""
+
+    def test_calculate_matches_function(self, simple_budget_data, simple_result):
+        """BudgetCalculator.calculate delegates to calculate_budget."""
+        assert BudgetCalculator(simple_budget_data).calculate() == simple_result
+
+    def test_raid_items_matches_function(self, empty_budget_data, budget_items_mixed):
+        """BudgetCalculator.get_budget_from_raid_items delegates to the function."""
+        calculator = BudgetCalculator(empty_budget_data)
+        assert calculator.get_budget_from_raid_items(budget_items_mixed) == \
+            get_budget_from_raid_items(budget_items_mixed)
+
+
 class TestBudgetCalculatorEmpty:
     """Tests for calculator with empty data."""
 
     def test_empty_timesheet_returns_default_metrics(self, empty_budget_data):
         """Empty timesheet returns metrics with defaults."""
-        calc = BudgetCalculator(empty_budget_data)
-        result = calc.calculate()
+        result = calc(empty_budget_data)
 
         assert isinstance(result, CalculatedBudget)
-        assert result.metrics.burn_to_date == 0.0
+        assert result.metrics.burn_to_date == pytest.approx(0.0)
         assert result.weekly_burn == []
         assert result.resource_burn == []
 
@@ -151,248 +217,134 @@ class TestBudgetCalculatorEmpty:
 class TestBudgetCalculatorBasic:
     """Tests for basic budget calculations."""
 
-    def test_budget_total_from_ledger(self, simple_budget_data):
+    def test_budget_total_from_ledger(self, simple_result):
         """Budget total is sum of ledger entries."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
-        assert result.metrics.budget_total == 50000.0
+        assert simple_result.metrics.budget_total == pytest.approx(50000.0)
 
-    def test_burn_to_date_from_timesheets(self, simple_budget_data):
+    def test_burn_to_date_from_timesheets(self, simple_result):
         """Burn to date sums complete week costs."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
         # 3 weeks * $6000 = $18000
-        assert result.metrics.burn_to_date == 18000.0
+        assert simple_result.metrics.burn_to_date == pytest.approx(18000.0)
 
-    def test_project_start_is_first_week(self, simple_budget_data):
+    def test_project_start_is_first_week(self, simple_result):
         """Project start is first billed week."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
-        assert result.metrics.proj_start == date(2024, 1, 7)
+        assert simple_result.metrics.proj_start == date(2024, 1, 7)
 
-    def test_project_end_from_roll_off(self, simple_budget_data):
+    def test_project_end_from_roll_off(self, simple_result):
         """Project end is max roll-off date."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
-        assert result.metrics.proj_end == date(2024, 6, 30)
+        assert simple_result.metrics.proj_end == date(2024, 6, 30)
 
-    def test_updates_thru_is_last_week(self, simple_budget_data):
+    def test_updates_thru_is_last_week(self, simple_result):
         """Updates through is last complete week."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
+        assert simple_result.metrics.updates_thru == date(2024, 1, 21)
 
-        assert result.metrics.updates_thru == date(2024, 1, 21)
-
-    def test_weekly_average_burn(self, simple_budget_data):
+    def test_weekly_average_burn(self, simple_result):
         """Weekly average is burn / weeks completed."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
         # $18000 / 2 weeks = $9000 (weeks_completed based on days)
         # Note: weeks_completed = round(14 days / 7) = 2
-        assert result.metrics.wkly_avg_burn == 9000.0
+        assert simple_result.metrics.wkly_avg_burn == pytest.approx(9000.0)
 
-    def test_burn_percentage(self, simple_budget_data):
+    def test_burn_percentage(self, simple_result):
         """Burn percentage calculated correctly."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
         # $18000 / $50000 = 36%
-        assert result.metrics.burn_pct == 36.0
+        assert simple_result.metrics.burn_pct == pytest.approx(36.0)
 
 
-class TestBudgetStatus:
-    """Tests for budget status determination."""
+def _make_status_data(rate, roll_off, budget, weeks):
+    """Single-resource budget billing 40h/week at rate for the given weeks."""
+    return BudgetData(
+        metadata=BudgetMetadata(project_name="Status"),
+        rate_card=[
+            RateCardEntry(name="Dev", geography="US", rate=rate, roll_off_date=roll_off),
+        ],
+        budget_ledger=[
+            BudgetLedgerEntry(amount=budget, date=date(2024, 1, 1)),
+        ],
+        timesheet_data=[_ts(w, "Alice", rate) for w in _weeks(date(2024, 1, 7), weeks)]
+    )
 
-    def test_under_budget_status(self):
-        """Under budget shows green status."""
-        # Short project with budget well above spending
-        data = BudgetData(
-            metadata=BudgetMetadata(project_name="Under Budget"),
-            rate_card=[
-                RateCardEntry(name="Dev", geography="US", rate=100.0,
-                             roll_off_date=date(2024, 1, 28)),  # Short project
-            ],
-            budget_ledger=[
-                BudgetLedgerEntry(amount=50000.0, date=date(2024, 1, 1)),
-            ],
-            timesheet_data=[
-                TimesheetEntry(week_ending=date(2024, 1, 7), resource="Alice",
-                              hours=40.0, rate=100.0, cost=4000.0, complete_week=True),
-                TimesheetEntry(week_ending=date(2024, 1, 14), resource="Alice",
-                              hours=40.0, rate=100.0, cost=4000.0, complete_week=True),
-            ]
-        )
 
-        calc = BudgetCalculator(data)
-        result = calc.calculate()
+class TestBudgetStatus:
+    """Tests for budget status determination."""
 
+    @pytest.mark.parametrize("rate,roll_off,budget,weeks,status,icon", [
         # $8000 burned, short remaining timeline, $50000 budget
-        assert result.metrics.budget_status == "under budget"
-        assert "🟢" in result.metrics.budget_status_icon
-
-    def test_over_budget_status(self):
-        """Over budget shows red status."""
-        data = BudgetData(
-            metadata=BudgetMetadata(project_name="Over Budget"),
-            rate_card=[
-                RateCardEntry(name="Dev", geography="US", rate=200.0,
-                             roll_off_date=date(2024, 3, 31)),
-            ],
-            budget_ledger=[
-                BudgetLedgerEntry(amount=10000.0, date=date(2024, 1, 1)),
-            ],
-            timesheet_data=[
-                TimesheetEntry(week_ending=date(2024, 1, 7), resource="Alice",
-                              hours=40.0, rate=200.0, cost=8000.0, complete_week=True),
-                TimesheetEntry(week_ending=date(2024, 1, 14), resource="Alice",
-                              hours=40.0, rate=200.0, cost=8000.0, complete_week=True),
-            ]
-        )
-
-        calc = BudgetCalculator(data)
-        result = calc.calculate()
-
+        (100.0, date(2024, 1, 28), 50000.0, 2, "under budget", "🟢"),
         # Burn to date: $16000, projected remaining: high, budget: $10000
-        assert result.metrics.budget_status == "over budget"
-        assert "🔴" in result.metrics.budget_status_icon
-
-    def test_within_15_percent_status(self):
-        """Within 15% remaining shows yellow status."""
-        data = BudgetData(
-            metadata=BudgetMetadata(project_name="Tight Budget"),
-            rate_card=[
-                RateCardEntry(name="Dev", geography="US", rate=150.0,
-                             roll_off_date=date(2024, 2, 14)),  # Short project
-            ],
-            budget_ledger=[
-                BudgetLedgerEntry(amount=20000.0, date=date(2024, 1, 1)),
-            ],
-            timesheet_data=[
-                TimesheetEntry(week_ending=date(2024, 1, 7), resource="Alice",
-                              hours=40.0, rate=150.0, cost=6000.0, complete_week=True),
-                TimesheetEntry(week_ending=date(2024, 1, 14), resource="Alice",
-                              hours=40.0, rate=150.0, cost=6000.0, complete_week=True),
-                TimesheetEntry(week_ending=date(2024, 1, 21), resource="Alice",
-                              hours=40.0, rate=150.0, cost=6000.0, complete_week=True),
-            ]
-        )
-
-        calc = BudgetCalculator(data)
-        result = calc.calculate()
+        (200.0, date(2024, 3, 31), 10000.0, 2, "over budget", "🔴"),
+        # $18000 burned with $20000 budget, rolling off at the last billed week
+        (150.0, date(2024, 1, 21), 20000.0, 3, "within 15%", "🟡"),
+    ], ids=["under", "over", "within_15_percent"])
+    def test_budget_status(self, rate, roll_off, budget, weeks, status, icon):
+        """Budget status and icon follow projected remaining budget."""
+        data = _make_status_data(rate, roll_off, budget, weeks)
+        result = calculate_budget(data)
 
-        # $18000 burned with $20000 budget, ~90% spent
-        # Check if within 15% triggers (budget_remaining < budget_total * 0.15)
-        if result.metrics.budget_remaining >= 0 and result.metrics.budget_remaining < 20000 * 0.15:
-            assert result.metrics.budget_status == "within 15%"
-            assert "🟡" in result.metrics.budget_status_icon
+        assert result.metrics.budget_status == status
+        assert icon in result.metrics.budget_status_icon
 
 
 class TestWeeklyBurnCalculation:
     """Tests for weekly burn trend calculation."""
 
-    def test_weekly_burn_list(self, simple_budget_data):
+    def test_weekly_burn_list(self, simple_result):
         """Weekly burn has entry per week."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
-        assert len(result.weekly_burn) == 3
+        assert len(simple_result.weekly_burn) == 3
 
-    def test_weekly_burn_sorted_by_date(self, simple_budget_data):
+    def test_weekly_burn_sorted_by_date(self, simple_result):
         """Weekly burn sorted chronologically."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
-        dates = [wb.week_ending for wb in result.weekly_burn]
+        dates = [wb.week_ending for wb in simple_result.weekly_burn]
         assert dates == sorted(dates)
 
-    def test_weekly_burn_cumulative(self, simple_budget_data):
+    def test_weekly_burn_cumulative(self, simple_result):
         """Cumulative totals are correct."""
-        calc = BudgetCalculator(simple_budget_data)
-        result = calc.calculate()
-
-        assert result.weekly_burn[0].cumulative == 6000.0
-        assert result.weekly_burn[1].cumulative == 12000.0
-        assert result.weekly_burn[2].cumulative == 18000.0
+        assert simple_result.weekly_burn[0].cumulative == pytest.approx(6000.0)
+        assert simple_result.weekly_burn[1].cumulative == pytest.approx(12000.0)
+        assert simple_result.weekly_burn[2].cumulative == pytest.approx(18000.0)
 
 
 class TestResourceBurnCalculation:
     """Tests for per-resource burn calculation."""
 
-    def test_resource_burn_aggregates_hours(self, multi_resource_budget_data):
+    def test_resource_burn_aggregates_hours(self, resource_map):
         """Resource hours aggregated across weeks."""
-        calc = BudgetCalculator(multi_resource_budget_data)
-        result = calc.calculate()
-
-        alice = next(r for r in result.resource_burn if r.resource == "Alice")
-        bob = next(r for r in result.resource_burn if r.resource == "Bob")
+        alice = resource_map["Alice"]
+        bob = resource_map["Bob"]
 
-        assert alice.hours == 72.0  # 40 + 32
-        assert bob.hours == 80.0    # 40 + 40
+        assert alice.hours == pytest.approx(72.0)  # 40 + 32
+        assert bob.hours == pytest.approx(80.0)    # 40 + 40
 
-    def test_resource_burn_aggregates_cost(self, multi_resource_budget_data):
+    def test_resource_burn_aggregates_cost(self, resource_map):
         """Resource costs aggregated across weeks."""
-        calc = BudgetCalculator(multi_resource_budget_data)
-        result = calc.calculate()
+        alice = resource_map["Alice"]
+        bob = resource_map["Bob"]
 
-        alice = next(r for r in result.resource_burn if r.resource == "Alice")
-        bob = next(r for r in result.resource_burn if r.resource == "Bob")
+        assert alice.cost == pytest.approx(12600.0)  # 7000 + 5600
+        assert bob.cost == pytest.approx(10000.0)    # 5000 + 5000
 
-        assert alice.cost == 12600.0  # 7000 + 5600
-        assert bob.cost == 10000.0    # 5000 + 5000
-
-    def test_resource_burn_sorted_by_cost(self, multi_resource_budget_data):
+    def test_resource_burn_sorted_by_cost(self, multi_resource_result):
         """Resources sorted by cost descending."""
-        calc = BudgetCalculator(multi_resource_budget_data)
-        result = calc.calculate()
-
-        costs = [r.cost for r in result.resource_burn]
+        costs = [r.cost for r in multi_resource_result.resource_burn]
         assert costs == sorted(costs, reverse=True)
 
 
 class TestBudgetFromRaidItems:
     """Tests for calculating budget from RAID items."""
 
-    def test_sums_budget_items(self, empty_budget_data):
+    def test_sums_budget_items(self, budget_items_mixed):
         """Sums budget_amount from Budget type items."""
-        calc = BudgetCalculator(empty_budget_data)
+        total = get_budget_from_raid_items(budget_items_mixed)
+        assert total == pytest.approx(75000.0)
 
-        items = [
-            Item(item_num=1, type="Budget", title="Initial", budget_amount=50000),
-            Item(item_num=2, type="Budget", title="Extension", budget_amount=25000),
-            Item(item_num=3, type="Action Item", title="Task", budget_amount=None),
-        ]
-
-        total = calc.get_budget_from_raid_items(items)
-        assert total == 75000.0
-
-    def test_ignores_non_budget_items(self, empty_budget_data):
+    def test_ignores_non_budget_items(self, non_budget_items):
         """Only Budget type items counted."""
-        calc = BudgetCalculator(empty_budget_data)
-
-        items = [
-            Item(item_num=1, type="Risk", title="Risk", budget_amount=10000),
-            Item(item_num=2, type="Action Item", title="Task", budget_amount=5000),
-        ]
-
-        total = calc.get_budget_from_raid_items(items)
-        assert total == 0.0
+        total = get_budget_from_raid_items(non_budget_items)
+        assert total == pytest.approx(0.0)
 
-    def test_handles_none_budget_amount(self, empty_budget_data):
+    def test_handles_none_budget_amount(self, budget_items_missing_amount):
         """Budget items with None amount treated as 0."""
-        calc = BudgetCalculator(empty_budget_data)
-
-        items = [
-            Item(item_num=1, type="Budget", title="No Amount", budget_amount=None),
-            Item(item_num=2, type="Budget", title="With Amount", budget_amount=10000),
-        ]
-
-        total = calc.get_budget_from_raid_items(items)
-        assert total == 10000.0
+        total = get_budget_from_raid_items(budget_items_missing_amount)
+        assert total == pytest.approx(10000.0)
 
 
 class TestIncompleteWeeks:
@@ -407,18 +359,15 @@ class TestIncompleteWeeks:
                 BudgetLedgerEntry(amount=50000.0, date=date(2024, 1, 1)),
             ],
             timesheet_data=[
-                TimesheetEntry(week_ending=date(2024, 1, 7), resource="Alice",
-                              hours=40.0, rate=150.0, cost=6000.0, complete_week=True),
-                TimesheetEntry(week_ending=date(2024, 1, 14), resource="Alice",
-                              hours=20.0, rate=150.0, cost=3000.0, complete_week=False),
+                _ts(date(2024, 1, 7), "Alice", 150.0),
+                _ts(date(2024, 1, 14), "Alice", 150.0, hours=20.0, complete=False),
             ]
         )
 
-        calc = BudgetCalculator(data)
-        result = calc.calculate()
+        result = calculate_budget(data)
 
         # Only complete week counted
-        assert result.metrics.burn_to_date == 6000.0
+        assert result.metrics.burn_to_date == pytest.approx(6000.0)
         assert len(result.weekly_burn) == 1
 
 
@@ -436,13 +385,9 @@ class TestMultipleLedgerEntries:
                 BudgetLedgerEntry(amount=-5000.0, date=date(2024, 4, 1), note="Reduction"),
             ],
             # Need at least one complete week for calculate() to process budget
-            timesheet_data=[
-                TimesheetEntry(week_ending=date(2024, 1, 7), resource="Test",
-                              hours=1.0, rate=100.0, cost=100.0, complete_week=True),
-            ]
+            timesheet_data=[_ts(date(2024, 1, 7), "Test", 100.0, hours=1.0)]
         )
 
-        calc = BudgetCalculator(data)
-        result = calc.calculate()
+        result = calculate_budget(data)
 
-        assert result.metrics.budget_total == 70000.0
+        assert result.metrics.budget_total == pytest.approx(70000.0)
@@ -6,19 +6,21 @@ Tests the Exporter class which generates Markdown and CSV reports.
 
 import pytest
 import csv
+import re
 from io import StringIO
 from datetime import date
 
 from src.core.exports import Exporter
 from src.core.models import Item, ProjectData, ProjectMetadata
 from src.core.budget import CalculatedBudget, BudgetMetrics
+from tests.helpers import assert_contains_all
 
 
 # =============================================================================
 # Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project_for_export():
     """Project with items in various states for export testing."""
     items = [
@@ -48,17 +50,18 @@ def sample_project_for_export():
              percent_complete=0, indicator=None),
     ]
 
-    return ProjectData(
-        metadata=ProjectMetadata(
+    # Shared by the whole session - a tuple keeps tests from adding/removing items
+    return ProjectData.from_iter(
+        ProjectMetadata(
             project_name="Test Export Project",
             client_name="Export Client",
             workstreams=["Development", "Testing", "General"]
         ),
-        items=items
+        items
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_budget_metrics():
     """Sample budget metrics for export testing."""
     return CalculatedBudget(
@@ -75,6 +78,72 @@ def sample_budget_metrics():
     )
 
 
+@pytest.fixture(scope="session")
+def exporter(sample_project_for_export):
+    """Exporter shared by tests that only read its output."""
+    return Exporter(sample_project_for_export)
+
+
+@pytest.fixture(scope="session")
+def md_active(exporter):
+    """Active items markdown, rendered once."""
+    return exporter.to_markdown_active()
+
+
+@pytest.fixture(scope="session")
+def md_summary(exporter):
+    """Summary markdown without budget, rendered once."""
+    return exporter.to_markdown_summary()
+
+
+@pytest.fixture(scope="session")
+def md_active_tokens(md_active):
+    """Words and #numbers in md_active, for whole-token checks."""
+    return frozenset(re.findall(r"[#\w]+", md_active))
+
+
+@pytest.fixture(scope="session")
+def md_summary_tokens(md_summary):
+    """Words and numbers in md_summary, for whole-token checks."""
+    return frozenset(re.findall(r"[#\w]+", md_summary))
+
+
+@pytest.fixture(scope="session")
+def md_table(exporter):
+    """Markdown table of all items, rendered once."""
+    return exporter.to_markdown_table()
+
+
+@pytest.fixture(scope="session")
+def csv_str(exporter):
+    """CSV of all items, rendered once."""
+    return exporter.to_csv()
+
+
+@pytest.fixture(scope="session")
+def csv_rows(csv_str):
+    """csv_str parsed into DictReader rows, once."""
+    return tuple(csv.DictReader(StringIO(csv_str)))
+
+
+@pytest.fixture(scope="session")
+def csv_rows_by_num(csv_rows):
+    """CSV rows keyed by their 'Item #' column."""
+    return {row['Item #']: row for row in csv_rows}
+
+
+@pytest.fixture(scope="session")
+def exports_dir(tmp_path_factory):
+    """One directory for every file written by the export tests."""
+    return tmp_path_factory.mktemp("exports")
+
+
+@pytest.fixture
+def export_path(exports_dir, request):
+    """Per-test file path (without suffix) inside exports_dir."""
+    return exports_dir / request.node.name
+
+
 # =============================================================================
 # Exporter Initialization Tests
 # =============================================================================
@@ -82,9 +151,8 @@ def sample_budget_metrics():
 class TestExporterInit:
     """Tests for Exporter initialization."""
 
-    def test_init_with_project_only(self, sample_project_for_export):
+    def test_init_with_project_only(self, exporter, sample_project_for_export):
         """Can create exporter with just project data."""
-        exporter = Exporter(sample_project_for_export)
         assert exporter.data == sample_project_for_export
         assert exporter.budget is None
 
@@ -101,64 +169,34 @@ class TestExporterInit:
 class TestMarkdownActiveExport:
     """Tests for active items markdown export."""
 
-    def test_contains_project_name(self, sample_project_for_export):
+    def test_contains_project_name(self, md_active):
         """Export contains project name."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_active()
-
-        assert "Test Export Project" in md
+        assert "Test Export Project" in md_active
 
-    def test_contains_critical_section(self, sample_project_for_export):
+    def test_contains_critical_section(self, md_active):
         """Export has critical section with critical items."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_active()
+        assert_contains_all(md_active, ["🔴 Critical", "Critical Risk", "Late Task"])
 
-        assert "🔴 Critical" in md
-        assert "Critical Risk" in md
-        assert "Late Task" in md
-
-    def test_contains_warning_section(self, sample_project_for_export):
+    def test_contains_warning_section(self, md_active):
         """Export has warning section with warning items."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_active()
+        assert_contains_all(md_active, ["🟡 Warning", "Warning Issue"])
 
-        assert "🟡 Warning" in md
-        assert "Warning Issue" in md
-
-    def test_contains_active_section(self, sample_project_for_export):
+    def test_contains_active_section(self, md_active):
         """Export has active section with in-progress items."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_active()
-
-        assert "🔵 Active" in md
-        assert "Active Task" in md
+        assert_contains_all(md_active, ["🔵 Active", "Active Task"])
 
-    def test_excludes_completed_items(self, sample_project_for_export):
+    def test_excludes_completed_items(self, md_active):
         """Completed items not in active export."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_active()
-
-        assert "Completed Decision" not in md
+        assert "Completed Decision" not in md_active
 
-    def test_excludes_draft_items(self, sample_project_for_export):
+    def test_excludes_draft_items(self, md_active):
         """Draft items not in active export."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_active()
+        assert "Draft Deliverable" not in md_active
 
-        assert "Draft Deliverable" not in md
-
-    def test_includes_item_details(self, sample_project_for_export):
+    def test_includes_item_details(self, md_active_tokens):
         """Item entries include relevant details."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_active()
-
-        # Should have item numbers
-        assert "#1" in md
-        assert "#4" in md
-
-        # Should have assignees
-        assert "Alice" in md
-        assert "Carol" in md
+        # Item numbers and assignees
+        assert_contains_all(md_active_tokens, ["#1", "#4", "Alice", "Carol"])
 
 
 # =============================================================================
@@ -168,51 +206,34 @@ class TestMarkdownActiveExport:
 class TestMarkdownSummaryExport:
     """Tests for summary markdown export."""
 
-    def test_contains_project_name(self, sample_project_for_export):
+    def test_contains_project_name(self, md_summary):
         """Summary contains project name."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_summary()
-
-        assert "Test Export Project" in md
+        assert "Test Export Project" in md_summary
 
-    def test_contains_status_table(self, sample_project_for_export):
+    def test_contains_status_table(self, md_summary):
         """Summary has status indicator table."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_summary()
-
-        assert "| Indicator | Count |" in md
+        assert "| Indicator | Count |" in md_summary
 
-    def test_counts_indicators(self, sample_project_for_export):
+    def test_counts_indicators(self, md_summary):
         """Summary counts items by indicator."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_summary()
-
-        assert "Beyond Deadline!!!" in md
-        assert "In Progress" in md
+        assert_contains_all(md_summary, ["Beyond Deadline!!!", "In Progress"])
 
-    def test_shows_total_items(self, sample_project_for_export):
+    def test_shows_total_items(self, md_summary, md_summary_tokens):
         """Summary shows total item count."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_summary()
-
-        assert "Total Items" in md
-        assert "6" in md
+        assert "Total Items" in md_summary
+        assert "6" in md_summary_tokens
 
     def test_includes_budget_when_available(self, sample_project_for_export, sample_budget_metrics):
         """Summary includes budget section when budget provided."""
         exporter = Exporter(sample_project_for_export, sample_budget_metrics)
         md = exporter.to_markdown_summary()
 
-        assert "Budget Summary" in md
-        assert "$100,000.00" in md
-        assert "45.0%" in md  # Formatted with one decimal place
+        # Burn percentage is formatted with one decimal place
+        assert_contains_all(md, ["Budget Summary", "$100,000.00", "45.0%"])
 
-    def test_no_budget_section_without_budget(self, sample_project_for_export):
+    def test_no_budget_section_without_budget(self, md_summary):
         """Summary omits budget section when no budget."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_summary()
-
-        assert "Budget Summary" not in md
+        assert "Budget Summary" not in md_summary
 
 
 # =============================================================================
@@ -222,24 +243,16 @@ class TestMarkdownSummaryExport:
 class TestMarkdownTableExport:
     """Tests for markdown table export."""
 
-    def test_has_header_row(self, sample_project_for_export):
+    def test_has_header_row(self, md_table):
         """Table has header row."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_table()
+        assert "| # | Type | Title |" in md_table
 
-        assert "| # | Type | Title |" in md
-
-    def test_has_all_items(self, sample_project_for_export):
+    def test_has_all_items(self, md_table, sample_project_for_export):
         """Table includes all items."""
-        exporter = Exporter(sample_project_for_export)
-        md = exporter.to_markdown_table()
-
-        for item in sample_project_for_export.items:
-            assert str(item.item_num) in md
+        assert_contains_all(md_table, [str(item.item_num) for item in sample_project_for_export.items])
 
-    def test_can_filter_items(self, sample_project_for_export):
+    def test_can_filter_items(self, exporter, sample_project_for_export):
         """Table can use filtered item list."""
-        exporter = Exporter(sample_project_for_export)
         filtered = [i for i in sample_project_for_export.items if i.type == "Action Item"]
         md = exporter.to_markdown_table(items=filtered)
 
@@ -255,11 +268,8 @@ class TestMarkdownTableExport:
 class TestCsvExport:
     """Tests for CSV export functionality."""
 
-    def test_returns_valid_csv(self, sample_project_for_export):
+    def test_returns_valid_csv(self, csv_str):
         """to_csv returns valid CSV string."""
-        exporter = Exporter(sample_project_for_export)
-        csv_str = exporter.to_csv()
-
         # Should be parseable
         reader = csv.reader(StringIO(csv_str))
         rows = list(reader)
@@ -267,13 +277,9 @@ class TestCsvExport:
         # Header + 6 items
         assert len(rows) == 7
 
-    def test_has_expected_columns(self, sample_project_for_export):
+    def test_has_expected_columns(self, csv_rows):
         """CSV has expected header columns."""
-        exporter = Exporter(sample_project_for_export)
-        csv_str = exporter.to_csv()
-
-        reader = csv.reader(StringIO(csv_str))
-        header = next(reader)
+        header = list(csv_rows[0])
 
         assert 'Item #' in header
         assert 'Type' in header
@@ -281,57 +287,30 @@ class TestCsvExport:
         assert 'Assigned To' in header
         assert 'Indicator' in header
 
-    def test_includes_all_items(self, sample_project_for_export):
+    def test_includes_all_items(self, csv_rows, csv_rows_by_num):
         """CSV includes all items."""
-        exporter = Exporter(sample_project_for_export)
-        csv_str = exporter.to_csv()
+        assert len(csv_rows) == 6
+        assert '1' in csv_rows_by_num
+        assert '6' in csv_rows_by_num
 
-        reader = csv.DictReader(StringIO(csv_str))
-        rows = list(reader)
-
-        assert len(rows) == 6
-        item_nums = [row['Item #'] for row in rows]
-        assert '1' in item_nums
-        assert '6' in item_nums
-
-    def test_formats_dates(self, sample_project_for_export):
+    def test_formats_dates(self, csv_rows):
         """CSV formats dates as YYYY-MM-DD."""
-        exporter = Exporter(sample_project_for_export)
-        csv_str = exporter.to_csv()
-
-        reader = csv.DictReader(StringIO(csv_str))
-        rows = list(reader)
-
-        first_item = rows[0]
+        first_item = csv_rows[0]
         assert first_item['Start'] == '2024-12-01'
 
-    def test_handles_none_values(self, sample_project_for_export):
+    def test_handles_none_values(self, csv_rows_by_num):
         """CSV handles None values gracefully."""
-        exporter = Exporter(sample_project_for_export)
-        csv_str = exporter.to_csv()
-
         # Draft item has no assigned_to
-        reader = csv.DictReader(StringIO(csv_str))
-        draft_row = [r for r in reader if r['Item #'] == '6'][0]
+        draft_row = csv_rows_by_num['6']
         assert draft_row['Assigned To'] == ''
 
-    def test_draft_column(self, sample_project_for_export):
+    def test_draft_column(self, csv_rows_by_num):
         """CSV has Draft column with Yes/No."""
-        exporter = Exporter(sample_project_for_export)
-        csv_str = exporter.to_csv()
-
-        reader = csv.DictReader(StringIO(csv_str))
-        rows = list(reader)
+        assert csv_rows_by_num['6']['Draft'] == 'Yes'
+        assert csv_rows_by_num['1']['Draft'] == 'No'
 
-        draft_row = [r for r in rows if r['Item #'] == '6'][0]
-        assert draft_row['Draft'] == 'Yes'
-
-        non_draft_row = [r for r in rows if r['Item #'] == '1'][0]
-        assert non_draft_row['Draft'] == 'No'
-
-    def test_can_filter_items(self, sample_project_for_export):
+    def test_can_filter_items(self, exporter, sample_project_for_export):
         """CSV can use filtered item list."""
-        exporter = Exporter(sample_project_for_export)
         filtered = [i for i in sample_project_for_export.items if i.workstream == "Development"]
         csv_str = exporter.to_csv(items=filtered)
 
@@ -349,26 +328,24 @@ class TestCsvExport:
 class TestCsvFileSave:
     """Tests for saving CSV to file."""
 
-    def test_save_creates_file(self, sample_project_for_export, tmp_path):
+    def test_save_creates_file(self, exporter, export_path):
         """save_csv creates file at path."""
-        exporter = Exporter(sample_project_for_export)
-        filepath = tmp_path / "export.csv"
+        filepath = export_path.with_suffix(".csv")
 
         exporter.save_csv(filepath)
 
         assert filepath.exists()
 
-    def test_saved_file_is_valid_csv(self, sample_project_for_export, tmp_path):
-        """Saved file is valid CSV."""
-        exporter = Exporter(sample_project_for_export)
-        filepath = tmp_path / "export.csv"
+    def test_saved_file_is_valid_csv(self, exporter, export_path, csv_str):
+        """Saved file is valid CSV, byte-for-byte the UTF-8 of to_csv()."""
+        filepath = export_path.with_suffix(".csv")
 
         exporter.save_csv(filepath)
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            rows = list(reader)
+        data = filepath.read_bytes()
+        rows = list(csv.reader(StringIO(data.decode('utf-8'), newline='')))
 
+        assert data == csv_str.encode('utf-8')
         assert len(rows) == 7  # Header + 6 items
 
 
@@ -379,26 +356,22 @@ class TestCsvFileSave:
 class TestMarkdownFileSave:
     """Tests for saving markdown to file."""
 
-    def test_save_creates_file(self, sample_project_for_export, tmp_path):
+    def test_save_creates_file(self, exporter, md_summary, export_path):
         """save_markdown creates file at path."""
-        exporter = Exporter(sample_project_for_export)
-        filepath = tmp_path / "export.md"
-        content = exporter.to_markdown_summary()
+        filepath = export_path.with_suffix(".md")
 
-        exporter.save_markdown(filepath, content)
+        exporter.save_markdown(filepath, md_summary)
 
         assert filepath.exists()
 
-    def test_saved_file_has_content(self, sample_project_for_export, tmp_path):
+    def test_saved_file_has_content(self, exporter, md_summary, export_path):
         """Saved file contains expected content."""
-        exporter = Exporter(sample_project_for_export)
-        filepath = tmp_path / "export.md"
-        content = exporter.to_markdown_summary()
+        filepath = export_path.with_suffix(".md")
 
-        exporter.save_markdown(filepath, content)
+        exporter.save_markdown(filepath, md_summary)
 
-        saved = filepath.read_text()
-        assert "Test Export Project" in saved
+        saved = filepath.read_bytes()
+        assert b"Test Export Project" in saved
 
 
 # =============================================================================
@@ -408,44 +381,49 @@ class TestMarkdownFileSave:
 class TestFilteredItemMethods:
     """Tests for convenience filter methods."""
 
-    def test_get_open_items(self, sample_project_for_export):
+    def test_get_open_items(self, exporter):
         """get_open_items returns non-completed items."""
-        exporter = Exporter(sample_project_for_export)
         open_items = exporter.get_open_items()
 
         # Item 5 is completed, so 5 open items
         assert len(open_items) == 5
         assert all(not i.is_complete for i in open_items)
 
-    def test_get_critical_items(self, sample_project_for_export):
+    def test_get_critical_items(self, exporter):
         """get_critical_items returns critical status items."""
-        exporter = Exporter(sample_project_for_export)
         critical = exporter.get_critical_items()
 
         # Items 1 and 2 are critical
         assert len(critical) == 2
         assert all(i.is_critical for i in critical)
 
-    def test_get_items_by_assignee(self, sample_project_for_export):
+    def test_get_items_by_assignee(self, exporter):
         """get_items_by_assignee filters by assignee."""
-        exporter = Exporter(sample_project_for_export)
         alice_items = exporter.get_items_by_assignee("Alice")
 
         assert len(alice_items) == 2
         assert all(i.assigned_to == "Alice" for i in alice_items)
 
-    def test_get_items_by_type(self, sample_project_for_export):
+    def test_get_items_by_type(self, exporter):
         """get_items_by_type filters by type."""
-        exporter = Exporter(sample_project_for_export)
         action_items = exporter.get_items_by_type("Action Item")
 
         assert len(action_items) == 2
         assert all(i.type == "Action Item" for i in action_items)
 
-    def test_get_items_by_workstream(self, sample_project_for_export):
+    def test_get_items_by_workstream(self, exporter):
         """get_items_by_workstream filters by workstream."""
-        exporter = Exporter(sample_project_for_export)
         dev_items = exporter.get_items_by_workstream("Development")
 
         assert len(dev_items) == 3
         assert all(i.workstream == "Development" for i in dev_items)
+
+    def test_filters_use_stored_indicator(self):
+        """Filters read item.indicator as set - they never recalculate it."""
+        # Dates say "late", but the stored indicator says completed
+        item = Item(item_num=1, type="Risk", title="Stored", indicator="Completed",
+                    start=date(2020, 1, 1), finish=date(2020, 1, 2))
+        exporter = Exporter(ProjectData(metadata=ProjectMetadata(project_name="P"), items=[item]))
+
+        assert exporter.get_open_items() == []
+        assert exporter.get_critical_items() == []
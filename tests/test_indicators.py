@@ -20,6 +20,7 @@ from src.core.indicators import (
     INDICATOR_CONFIG,
     SEVERITY_ORDER,
 )
+from tests.helpers import make_item
 
 
 class TestNetworkdays:
@@ -53,11 +54,27 @@ class TestNetworkdays:
         assert networkdays(date(2024, 12, 15), None) == 0
         assert networkdays(None, None) == 0
 
+    def test_end_before_start(self):
+        """Reversed range has no business days."""
+        assert networkdays(date(2024, 12, 20), date(2024, 12, 16)) == 0
+
+    def test_matches_day_by_day_count(self):
+        """Closed form agrees with counting each day, from every weekday."""
+        for offset in range(7):
+            start = date(2024, 12, 16) + timedelta(days=offset)
+            for length in range(30):
+                end = start + timedelta(days=length)
+                expected = sum(
+                    1 for k in range(length + 1)
+                    if (start + timedelta(days=k)).weekday() < 5
+                )
+                assert networkdays(start, end) == expected
+
 
 class TestCompletedIndicators:
     """Tests for completed item indicators."""
 
-    def test_completed_100_percent(self, make_item, today, two_weeks_ago):
+    def test_completed_100_percent(self, today, two_weeks_ago):
         """100% complete with old finish date = Completed."""
         item = make_item(
             percent_complete=100,
@@ -65,7 +82,7 @@ class TestCompletedIndicators:
         )
         assert calculate_indicator(item, today) == "Completed"
 
-    def test_completed_recently(self, make_item, today, one_week_ago):
+    def test_completed_recently(self, today, one_week_ago):
         """100% complete with recent finish = Completed Recently."""
         item = make_item(
             percent_complete=100,
@@ -73,7 +90,7 @@ class TestCompletedIndicators:
         )
         assert calculate_indicator(item, today) == "Completed Recently"
 
-    def test_completed_recently_same_day(self, make_item, today):
+    def test_completed_recently_same_day(self, today):
         """100% complete finishing today = Completed Recently."""
         item = make_item(percent_complete=100, finish=today)
         assert calculate_indicator(item, today) == "Completed Recently"
@@ -82,7 +99,7 @@ class TestCompletedIndicators:
 class TestCriticalIndicators:
     """Tests for critical (red) indicators."""
 
-    def test_beyond_deadline(self, make_item, today, one_week_ago):
+    def test_beyond_deadline(self, today, one_week_ago):
         """Past deadline with incomplete work = Beyond Deadline!!!"""
         item = make_item(
             percent_complete=50,
@@ -90,7 +107,7 @@ class TestCriticalIndicators:
         )
         assert calculate_indicator(item, today) == "Beyond Deadline!!!"
 
-    def test_late_finish(self, make_item, today, one_week_ago):
+    def test_late_finish(self, today, one_week_ago):
         """Past finish date, not complete = Late Finish!!"""
         item = make_item(
             percent_complete=75,
@@ -99,7 +116,7 @@ class TestCriticalIndicators:
         )
         assert calculate_indicator(item, today) == "Late Finish!!"
 
-    def test_late_start(self, make_item, today, one_week_ago):
+    def test_late_start(self, today, one_week_ago):
         """Past start date, 0% complete = Late Start!!"""
         item = make_item(
             percent_complete=0,
@@ -108,7 +125,7 @@ class TestCriticalIndicators:
         )
         assert calculate_indicator(item, today) == "Late Start!!"
 
-    def test_deadline_takes_priority_over_late_finish(self, make_item, today, one_week_ago):
+    def test_deadline_takes_priority_over_late_finish(self, today, one_week_ago):
         """Beyond Deadline takes priority over Late Finish."""
         item = make_item(
             percent_complete=50,
@@ -121,7 +138,7 @@ class TestCriticalIndicators:
 class TestWarningIndicators:
     """Tests for warning (yellow) indicators."""
 
-    def test_trending_late(self, make_item, today, one_week_ago, one_week_ahead):
+    def test_trending_late(self, today, one_week_ago, one_week_ahead):
         """50% work remaining with less time remaining = Trending Late!"""
         # Started 7 days ago, finishes in 7 days (14 day duration)
         # Only 25% complete means 75% remaining work (10.5 days worth)
@@ -134,7 +151,7 @@ class TestWarningIndicators:
         )
         assert calculate_indicator(item, today) == "Trending Late!"
 
-    def test_not_trending_late_if_on_track(self, make_item, today, one_week_ago, one_week_ahead):
+    def test_not_trending_late_if_on_track(self, today, one_week_ago, one_week_ahead):
         """On-track progress should not show Trending Late."""
         # Started 7 days ago, finishes in 7 days (14 day duration)
         # 50% complete means 7 days of work remaining, 7 days of time remaining
@@ -152,7 +169,7 @@ class TestWarningIndicators:
 class TestUpcomingIndicators:
     """Tests for upcoming (blue/purple) indicators."""
 
-    def test_finishing_soon(self, make_item, today, one_week_ahead):
+    def test_finishing_soon(self, today, one_week_ahead):
         """Finish within 2 weeks, in progress = Finishing Soon!"""
         item = make_item(
             percent_complete=50,
@@ -161,7 +178,7 @@ class TestUpcomingIndicators:
         )
         assert calculate_indicator(item, today) == "Finishing Soon!"
 
-    def test_starting_soon(self, make_item, today):
+    def test_starting_soon(self, today):
         """Start within 2 weeks, 0% = Starting Soon!"""
         item = make_item(
             percent_complete=0,
@@ -170,7 +187,7 @@ class TestUpcomingIndicators:
         )
         assert calculate_indicator(item, today) == "Starting Soon!"
 
-    def test_starting_today(self, make_item, today):
+    def test_starting_today(self, today):
         """Start date is today, 0% = Starting Soon! (when finish is far out)."""
         item = make_item(
             percent_complete=0,
@@ -179,7 +196,7 @@ class TestUpcomingIndicators:
         )
         assert calculate_indicator(item, today) == "Starting Soon!"
 
-    def test_starting_today_with_near_finish_shows_finishing_soon(self, make_item, today):
+    def test_starting_today_with_near_finish_shows_finishing_soon(self, today):
         """When both start and finish are within 2 weeks, Finishing Soon takes precedence."""
         item = make_item(
             percent_complete=0,
@@ -193,7 +210,7 @@ class TestUpcomingIndicators:
 class TestActiveIndicators:
     """Tests for in-progress indicators."""
 
-    def test_in_progress(self, make_item, today, three_weeks_ahead):
+    def test_in_progress(self, today, three_weeks_ahead):
         """Started but not near finish = In Progress."""
         item = make_item(
             percent_complete=30,
@@ -202,7 +219,7 @@ class TestActiveIndicators:
         )
         assert calculate_indicator(item, today) == "In Progress"
 
-    def test_not_started(self, make_item, today, three_weeks_ahead):
+    def test_not_started(self, today, three_weeks_ahead):
         """Has dates but 0% = Not Started."""
         item = make_item(
             percent_complete=0,
@@ -215,7 +232,7 @@ class TestActiveIndicators:
 class TestDraftItems:
     """Tests for draft item handling."""
 
-    def test_draft_no_indicator(self, make_item, today, one_week_ago):
+    def test_draft_no_indicator(self, today, one_week_ago):
         """Draft items get no indicator regardless of dates."""
         item = make_item(
             percent_complete=0,
@@ -229,12 +246,12 @@ class TestDraftItems:
 class TestItemWithoutDates:
     """Tests for items without dates."""
 
-    def test_no_dates_no_indicator(self, make_item, today):
+    def test_no_dates_no_indicator(self, today):
         """Item with no dates and 0% = no indicator."""
         item = make_item(percent_complete=0)
         assert calculate_indicator(item, today) is None
 
-    def test_in_progress_no_dates(self, make_item, today):
+    def test_in_progress_no_dates(self, today):
         """Item with no dates but >0% = In Progress."""
         item = make_item(percent_complete=25)
         assert calculate_indicator(item, today) == "In Progress"
@@ -297,7 +314,7 @@ class TestIndicatorConfig:
 class TestSortBySeverity:
     """Tests for severity-based sorting."""
 
-    def test_critical_before_warning(self, make_item, today):
+    def test_critical_before_warning(self, today):
         """Critical items sort before warning items."""
         critical = make_item(item_num=1, title="Critical", deadline=today - timedelta(days=1))
         warning = make_item(item_num=2, title="Warning", percent_complete=25,
@@ -308,7 +325,7 @@ class TestSortBySeverity:
 
         assert sorted_items[0] == critical
 
-    def test_completed_sorts_last(self, make_item, today, three_weeks_ahead):
+    def test_completed_sorts_last(self, today, three_weeks_ahead):
         """Completed items sort after active items."""
         completed = make_item(item_num=1, title="Done", percent_complete=100,
                              finish=today - timedelta(days=20))
@@ -320,3 +337,11 @@ class TestSortBySeverity:
 
         assert sorted_items[0] == active
         assert sorted_items[1] == completed
+
+    def test_unknown_indicator_sorts_last(self):
+        """Items without a configured indicator sort after every known one."""
+        done = make_item(item_num=1, title="B", indicator="Completed")
+        unknown = make_item(item_num=2, title="A", indicator="Bogus")
+        blank = make_item(item_num=3, title="C", indicator=None)
+
+        assert sort_by_severity([blank, unknown, done]) == [done, unknown, blank]
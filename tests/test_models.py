@@ -20,6 +20,7 @@ from src.core.models import (
     TimesheetEntry,
     BudgetLedgerEntry,
 )
+from tests.helpers import make_item
 
 
 class TestItem:
@@ -65,63 +66,72 @@ class TestItem:
         assert item.dep_item_num == [1, 2, 3]
         assert item.budget_amount == 10000.00
 
-    def test_is_complete_with_completed_indicator(self):
+    @pytest.mark.parametrize("indicator", ["Completed", "Completed Recently"])
+    def test_is_complete_with_completed_indicator(self, blank_item, indicator):
         """is_complete returns True for completed indicators."""
-        item = Item(item_num=1, type="Action Item", title="Test", indicator="Completed")
-        assert item.is_complete is True
+        blank_item.indicator = indicator
+        assert blank_item.is_complete is True
 
-        item.indicator = "Completed Recently"
-        assert item.is_complete is True
-
-    def test_is_complete_with_active_indicator(self):
+    def test_is_complete_with_active_indicator(self, blank_item):
         """is_complete returns False for non-completed indicators."""
-        item = Item(item_num=1, type="Action Item", title="Test", indicator="In Progress")
-        assert item.is_complete is False
+        blank_item.indicator = "In Progress"
+        assert blank_item.is_complete is False
 
-        item.indicator = "Late Finish!!"
-        assert item.is_complete is False
+        blank_item.indicator = "Late Finish!!"
+        assert blank_item.is_complete is False
 
-    def test_is_open_inverse_of_complete(self):
+    def test_is_open_inverse_of_complete(self, blank_item):
         """is_open is inverse of is_complete."""
-        item = Item(item_num=1, type="Action Item", title="Test", indicator="In Progress")
-        assert item.is_open is True
-        assert item.is_complete is False
-
-        item.indicator = "Completed"
-        assert item.is_open is False
-        assert item.is_complete is True
-
-    def test_is_active(self):
+        blank_item.indicator = "In Progress"
+        assert blank_item.is_open is True
+        assert blank_item.is_complete is False
+
+        blank_item.indicator = "Completed"
+        assert blank_item.is_open is False
+        assert blank_item.is_complete is True
+
+    @pytest.mark.parametrize("indicator,expected", [
+        ("In Progress", True),
+        ("Finishing Soon!", True),
+        ("Starting Soon!", True),
+        ("Completed", False),
+    ])
+    def test_is_active(self, blank_item, indicator, expected):
         """is_active returns True for active indicators."""
-        active_indicators = ["In Progress", "Finishing Soon!", "Starting Soon!"]
-        item = Item(item_num=1, type="Action Item", title="Test")
-
-        for indicator in active_indicators:
-            item.indicator = indicator
-            assert item.is_active is True, f"Expected active for {indicator}"
-
-        item.indicator = "Completed"
-        assert item.is_active is False
-
-    def test_is_critical(self):
+        blank_item.indicator = indicator
+        assert blank_item.is_active is expected
+
+    @pytest.mark.parametrize("indicator,expected", [
+        ("Beyond Deadline!!!", True),
+        ("Late Finish!!", True),
+        ("Late Start!!", True),
+        ("In Progress", False),
+    ])
+    def test_is_critical(self, blank_item, indicator, expected):
         """is_critical returns True for critical indicators."""
-        critical_indicators = ["Beyond Deadline!!!", "Late Finish!!", "Late Start!!"]
-        item = Item(item_num=1, type="Action Item", title="Test")
-
-        for indicator in critical_indicators:
-            item.indicator = indicator
-            assert item.is_critical is True, f"Expected critical for {indicator}"
-
-        item.indicator = "In Progress"
-        assert item.is_critical is False
+        blank_item.indicator = indicator
+        assert blank_item.is_critical is expected
 
-    def test_is_warning(self):
+    def test_is_warning(self, blank_item):
         """is_warning returns True for warning indicators."""
-        item = Item(item_num=1, type="Action Item", title="Test", indicator="Trending Late!")
-        assert item.is_warning is True
-
-        item.indicator = "In Progress"
-        assert item.is_warning is False
+        blank_item.indicator = "Trending Late!"
+        assert blank_item.is_warning is True
+
+        blank_item.indicator = "In Progress"
+        assert blank_item.is_warning is False
+
+    @pytest.mark.parametrize("indicator,state", [
+        ("Resolved", "complete"),
+        ("Starting Soon!", "active"),
+        ("Late Start!!", "critical"),
+        ("Trending Late!", "warning"),
+        ("Not Started", None),
+        (None, None),
+    ])
+    def test_state(self, blank_item, indicator, state):
+        """state maps the indicator to its status group."""
+        blank_item.indicator = indicator
+        assert blank_item.state == state
 
 
 class TestProjectMetadata:
@@ -132,7 +142,7 @@ class TestProjectMetadata:
         meta = ProjectMetadata(project_name="Test Project")
         assert meta.project_name == "Test Project"
         assert meta.next_item_num == 1
-        assert meta.workstreams == []
+        assert meta.workstreams == ()
 
     def test_metadata_creation_full(self):
         """Metadata can be created with all fields."""
@@ -160,6 +170,20 @@ class TestProjectData:
         assert project.metadata.project_name == "Test Project"
         assert len(project.items) == 5
 
+    def test_from_iter_stores_tuple(self, sample_metadata):
+        """from_iter stores items as a tuple."""
+        project = ProjectData.from_iter(sample_metadata, (make_item(item_num=n) for n in (1, 2)))
+
+        assert isinstance(project.items, tuple)
+        assert [i.item_num for i in project.items] == [1, 2]
+
+    def test_sample_items_immutable(self, sample_items, sample_project):
+        """Shared sample collections can't be appended to."""
+        with pytest.raises(AttributeError):
+            sample_items.append(make_item(item_num=99))
+        with pytest.raises(AttributeError):
+            sample_project.items.append(make_item(item_num=99))
+
     def test_get_item_found(self, sample_project):
         """get_item returns item when found."""
         item = sample_project.get_item(1)
@@ -171,6 +195,13 @@ class TestProjectData:
         item = sample_project.get_item(999)
         assert item is None
 
+    def test_get_item_first_duplicate_wins(self):
+        """get_item returns the first item when numbers repeat."""
+        first, second = make_item(item_num=7, title="First"), make_item(item_num=7, title="Second")
+        project = ProjectData(metadata=ProjectMetadata(project_name="Test"), items=[first, second])
+
+        assert project.get_item(7) is first
+
     def test_get_open_items(self, sample_project):
         """get_open_items returns non-completed items."""
         # First set indicators so is_complete works
@@ -186,6 +217,17 @@ class TestProjectData:
         assert len(open_items) == 4
         assert sample_project.items[0] not in open_items
 
+    def test_get_open_items_cached_until_touch(self, sample_project):
+        """get_open_items reuses its scan until touch(), returning fresh lists."""
+        first = sample_project.get_open_items()
+        first.clear()
+        sample_project.items[0].indicator = "Completed"
+
+        assert len(sample_project.get_open_items()) == 5
+
+        sample_project.touch()
+        assert len(sample_project.get_open_items()) == 4
+
     def test_get_items_by_type(self, sample_project):
         """get_items_by_type filters correctly."""
         action_items = sample_project.get_items_by_type("Action Item")
@@ -194,7 +236,7 @@ class TestProjectData:
         risks = sample_project.get_items_by_type("Risk")
         assert len(risks) == 1
 
-    def test_get_items_by_assignee(self, make_item):
+    def test_get_items_by_assignee(self):
         """get_items_by_assignee filters correctly."""
         items = [
             make_item(item_num=1, assigned_to="Alice"),
@@ -213,7 +255,7 @@ class TestProjectData:
         bob_items = project.get_items_by_assignee("Bob")
         assert len(bob_items) == 1
 
-    def test_get_items_by_workstream(self, make_item):
+    def test_get_items_by_workstream(self):
         """get_items_by_workstream filters correctly."""
         items = [
             make_item(item_num=1, workstream="Dev"),
@@ -228,6 +270,66 @@ class TestProjectData:
         dev_items = project.get_items_by_workstream("Dev")
         assert len(dev_items) == 2
 
+    def test_items_by_type(self, sample_project):
+        """items_by_type groups items into tuples per type."""
+        by_type = sample_project.items_by_type
+
+        assert len(by_type["Action Item"]) == 2  # items 1 and 2
+        assert by_type["Risk"] == (sample_project.items[2],)
+        assert "Budget" not in by_type
+
+    def test_items_by_assignee_and_workstream(self):
+        """Assignee and workstream groupings key unset values under None."""
+        items = [
+            make_item(item_num=1, assigned_to="Alice", workstream="Dev"),
+            make_item(item_num=2, assigned_to="Alice"),
+            make_item(item_num=3, workstream="Dev"),
+        ]
+        project = ProjectData(metadata=ProjectMetadata(project_name="Test"), items=items)
+
+        assert project.items_by_assignee == {"Alice": (items[0], items[1]), None: (items[2],)}
+        assert project.items_by_workstream == {"Dev": (items[0], items[2]), None: (items[1],)}
+
+    def test_open_and_critical_items(self, sample_project):
+        """open_items and critical_items filter on indicator."""
+        sample_project.items[0].indicator = "Completed"
+        sample_project.items[3].indicator = "Late Finish!!"
+
+        assert len(sample_project.open_items) == 4
+        assert sample_project.critical_items == (sample_project.items[3],)
+
+    def test_views_cached_until_touch(self, sample_project):
+        """Cached views only see item edits after touch()."""
+        assert sample_project.critical_items == ()
+
+        sample_project.items[0].indicator = "Late Start!!"
+        assert sample_project.critical_items == ()
+
+        sample_project.touch()
+        assert sample_project.critical_items == (sample_project.items[0],)
+
+    def test_views_follow_added_and_removed_items(self):
+        """Appending to or removing from items rebuilds views without touch()."""
+        items = [make_item(item_num=1, type="Risk")]
+        project = ProjectData(metadata=ProjectMetadata(project_name="Test"), items=items)
+        assert project.get_item(2) is None
+
+        items.append(make_item(item_num=2, type="Risk"))
+        assert project.get_item(2) is items[1]
+        assert len(project.get_items_by_type("Risk")) == 2
+
+        items.pop(0)
+        assert project.get_item(1) is None
+
+    def test_views_follow_reassigned_items(self, sample_project):
+        """Replacing the items sequence rebuilds views without touch()."""
+        assert sample_project.get_item(1) is not None
+
+        sample_project.items = (make_item(item_num=42),)
+
+        assert sample_project.get_item(1) is None
+        assert sample_project.get_item(42) is sample_project.items[0]
+
 
 class TestNote:
     """Tests for Note dataclass."""
@@ -248,25 +350,31 @@ class TestNote:
 class TestItemType:
     """Tests for ItemType enum."""
 
-    def test_item_types_exist(self):
+    @pytest.mark.parametrize("member,value", [
+        (ItemType.BUDGET, "Budget"),
+        (ItemType.RISK, "Risk"),
+        (ItemType.ACTION_ITEM, "Action Item"),
+        (ItemType.ISSUE, "Issue"),
+        (ItemType.DECISION, "Decision"),
+        (ItemType.DELIVERABLE, "Deliverable"),
+        (ItemType.PLAN_ITEM, "Plan Item"),
+    ], ids=lambda v: v.name if isinstance(v, ItemType) else None)
+    def test_item_types_exist(self, member, value):
         """All expected item types exist."""
-        assert ItemType.BUDGET.value == "Budget"
-        assert ItemType.RISK.value == "Risk"
-        assert ItemType.ACTION_ITEM.value == "Action Item"
-        assert ItemType.ISSUE.value == "Issue"
-        assert ItemType.DECISION.value == "Decision"
-        assert ItemType.DELIVERABLE.value == "Deliverable"
-        assert ItemType.PLAN_ITEM.value == "Plan Item"
+        assert member.value == value
 
 
 class TestIndicatorEnum:
     """Tests for Indicator enum."""
 
-    def test_indicator_values(self):
+    @pytest.mark.parametrize("member,value", [
+        (Indicator.BEYOND_DEADLINE, "Beyond Deadline!!!"),
+        (Indicator.COMPLETED, "Completed"),
+        (Indicator.IN_PROGRESS, "In Progress"),
+    ], ids=lambda v: v.name if isinstance(v, Indicator) else None)
+    def test_indicator_values(self, member, value):
         """Indicator enum has expected values."""
-        assert Indicator.BEYOND_DEADLINE.value == "Beyond Deadline!!!"
-        assert Indicator.COMPLETED.value == "Completed"
-        assert Indicator.IN_PROGRESS.value == "In Progress"
+        assert member.value == value
 
 
 class TestBudgetModels:
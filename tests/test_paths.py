@@ -19,6 +19,14 @@ from src.core.paths import (
 )
 
 
+@pytest.fixture
+def app_data_dir(tmp_path, monkeypatch):
+    """Point get_app_data_dir at a not-yet-created directory under tmp_path."""
+    test_dir = tmp_path / "BRAID Manager"
+    monkeypatch.setattr('src.core.paths.get_app_data_dir', lambda: test_dir)
+    return test_dir
+
+
 class TestAppName:
     """Tests for app identity constants."""
 
@@ -80,53 +88,38 @@ class TestGetDefaultProjectDir:
 class TestEnsureAppDirectories:
     """Tests for ensure_app_directories function."""
 
-    def test_returns_path(self, tmp_path, monkeypatch):
+    def test_returns_path(self, app_data_dir):
         """Returns the app data directory path."""
-        # Mock get_app_data_dir to use temp directory
-        test_dir = tmp_path / "BRAID Manager"
-        monkeypatch.setattr('src.core.paths.get_app_data_dir', lambda: test_dir)
-
         result = ensure_app_directories()
-        assert result == test_dir
+        assert result == app_data_dir
 
-    def test_creates_directories(self, tmp_path, monkeypatch):
+    def test_creates_directories(self, app_data_dir):
         """Creates app directory and subdirectories."""
-        test_dir = tmp_path / "BRAID Manager"
-        monkeypatch.setattr('src.core.paths.get_app_data_dir', lambda: test_dir)
-
         ensure_app_directories()
 
-        assert test_dir.exists()
-        assert (test_dir / "projects").exists()
-        assert (test_dir / "projects" / "default").exists()
+        assert app_data_dir.exists()
+        assert (app_data_dir / "projects").exists()
+        assert (app_data_dir / "projects" / "default").exists()
 
-    def test_idempotent(self, tmp_path, monkeypatch):
+    def test_idempotent(self, app_data_dir):
         """Can be called multiple times safely."""
-        test_dir = tmp_path / "BRAID Manager"
-        monkeypatch.setattr('src.core.paths.get_app_data_dir', lambda: test_dir)
-
         # Call twice
         ensure_app_directories()
         ensure_app_directories()
 
-        assert test_dir.exists()
+        assert app_data_dir.exists()
 
 
 class TestIsFirstRun:
     """Tests for is_first_run function."""
 
-    def test_first_run_when_no_dir(self, tmp_path, monkeypatch):
+    def test_first_run_when_no_dir(self, app_data_dir):
         """Returns True when app data dir doesn't exist."""
-        test_dir = tmp_path / "nonexistent" / "BRAID Manager"
-        monkeypatch.setattr('src.core.paths.get_app_data_dir', lambda: test_dir)
-
         assert is_first_run() is True
 
-    def test_not_first_run_when_dir_exists(self, tmp_path, monkeypatch):
+    def test_not_first_run_when_dir_exists(self, app_data_dir):
         """Returns False when app data dir exists."""
-        test_dir = tmp_path / "BRAID Manager"
-        test_dir.mkdir(parents=True)
-        monkeypatch.setattr('src.core.paths.get_app_data_dir', lambda: test_dir)
+        app_data_dir.mkdir(parents=True)
 
         assert is_first_run() is False
 
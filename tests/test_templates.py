@@ -14,56 +14,81 @@ from src.core.templates import (
 from src.core.models import ProjectData, Item
 
 
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+FROZEN_TODAY = date(2024, 6, 15)
+
+
+class _FrozenDate(date):
+    """date whose today() is always FROZEN_TODAY."""
+
+    @classmethod
+    def today(cls):
+        return FROZEN_TODAY
+
+
+@pytest.fixture
+def frozen_today(monkeypatch):
+    """Freeze date.today() inside the templates module."""
+    monkeypatch.setattr('src.core.templates.date', _FrozenDate)
+    return FROZEN_TODAY
+
+
+@pytest.fixture(scope="module")
+def new_project():
+    """Default new project, shared by the read-only tests below."""
+    return create_new_project()
+
+
+@pytest.fixture(scope="module")
+def custom_project():
+    """New project with a custom project and client name."""
+    return create_new_project(project_name="My Custom Project", client_name="Acme Corp")
+
+
 class TestCreateNewProject:
     """Tests for create_new_project function."""
 
-    def test_returns_project_data(self):
+    def test_returns_project_data(self, new_project):
         """Returns a ProjectData instance."""
-        result = create_new_project()
-        assert isinstance(result, ProjectData)
+        assert isinstance(new_project, ProjectData)
 
-    def test_default_project_name(self):
+    def test_default_project_name(self, new_project):
         """Uses default project name when not specified."""
-        result = create_new_project()
-        assert result.metadata.project_name == "New Project"
+        assert new_project.metadata.project_name == "New Project"
 
-    def test_custom_project_name(self):
+    def test_custom_project_name(self, custom_project):
         """Uses custom project name when provided."""
-        result = create_new_project(project_name="My Custom Project")
-        assert result.metadata.project_name == "My Custom Project"
+        assert custom_project.metadata.project_name == "My Custom Project"
 
-    def test_custom_client_name(self):
+    def test_custom_client_name(self, custom_project):
         """Uses custom client name when provided."""
-        result = create_new_project(client_name="Acme Corp")
-        assert result.metadata.client_name == "Acme Corp"
+        assert custom_project.metadata.client_name == "Acme Corp"
 
-    def test_metadata_has_today_date(self):
+    def test_metadata_has_today_date(self, frozen_today):
         """Metadata uses today's date."""
         result = create_new_project()
-        today = date.today()
-        assert result.metadata.last_updated == today
-        assert result.metadata.project_start == today
-        assert result.metadata.indicators_updated == today
+        assert result.metadata.last_updated == frozen_today
+        assert result.metadata.project_start == frozen_today
+        assert result.metadata.indicators_updated == frozen_today
 
-    def test_next_item_num_is_2(self):
+    def test_next_item_num_is_2(self, new_project):
         """next_item_num is 2 (after starter item)."""
-        result = create_new_project()
-        assert result.metadata.next_item_num == 2
+        assert new_project.metadata.next_item_num == 2
 
-    def test_default_workstream(self):
+    def test_default_workstream(self, new_project):
         """Has 'General' as default workstream."""
-        result = create_new_project()
-        assert "General" in result.metadata.workstreams
+        assert "General" in new_project.metadata.workstreams
 
-    def test_has_starter_item(self):
+    def test_has_starter_item(self, new_project):
         """Creates a starter item."""
-        result = create_new_project()
-        assert len(result.items) == 1
+        assert len(new_project.items) == 1
 
-    def test_starter_item_properties(self):
+    def test_starter_item_properties(self, new_project):
         """Starter item has expected properties."""
-        result = create_new_project()
-        item = result.items[0]
+        item = new_project.items[0]
 
         assert item.item_num == 1
         assert item.type == "Action Item"
@@ -76,27 +101,32 @@ class TestCreateNewProject:
 class TestStarterItem:
     """Tests for the starter item created in new projects."""
 
-    def test_starter_item_is_item(self):
+    def test_starter_item_is_item(self, new_project):
         """Starter item is an Item instance."""
-        result = create_new_project()
-        assert isinstance(result.items[0], Item)
+        assert isinstance(new_project.items[0], Item)
 
-    def test_starter_item_has_today_start(self):
+    def test_starter_item_has_today_start(self, frozen_today):
         """Starter item has today as start date."""
         result = create_new_project()
         item = result.items[0]
-        assert item.start == date.today()
+        assert item.start == frozen_today
 
-    def test_starter_item_not_draft(self):
+    def test_dates_share_one_today(self, new_project):
+        """Metadata and starter item dates all come from one date.today() call."""
+        meta, item = new_project.metadata, new_project.items[0]
+        dates = {meta.last_updated, meta.project_start, meta.indicators_updated,
+                 item.start, item.created_date, item.last_updated}
+
+        assert len(dates) == 1
+
+    def test_starter_item_not_draft(self, new_project):
         """Starter item is not a draft."""
-        result = create_new_project()
-        item = result.items[0]
+        item = new_project.items[0]
         assert item.draft is False
 
-    def test_starter_item_client_visible(self):
+    def test_starter_item_client_visible(self, new_project):
         """Starter item is client visible."""
-        result = create_new_project()
-        item = result.items[0]
+        item = new_project.items[0]
         assert item.client_visible is True
 
 
@@ -5,12 +5,15 @@ Tests the YamlStore class which handles loading and saving RAID logs and Budget
 Uses temporary files to avoid external dependencies.
 """
 
+import os
 import pytest
 from pathlib import Path
 from datetime import date, datetime
 
 from src.core.yaml_store import (
     YamlStore,
+    _RAW_CACHE_SIZE,
+    _raw_cache,
     _parse_date,
     _format_date,
 )
@@ -24,55 +27,58 @@ from src.core.models import (
     TimesheetEntry,
     BudgetLedgerEntry,
 )
+from tests.helpers import make_item
 
 
-class TestParseDateHelper:
-    """Tests for _parse_date helper function."""
+@pytest.fixture
+def store(tmp_path):
+    """YamlStore rooted at the test's tmp_path."""
+    return YamlStore(data_dir=tmp_path)
 
-    def test_parse_none(self):
-        """None input returns None."""
-        assert _parse_date(None) is None
 
-    def test_parse_date_object(self):
-        """date object returns same date."""
-        d = date(2024, 12, 15)
-        assert _parse_date(d) == d
+@pytest.fixture(scope="session")
+def discovery_dir(tmp_path_factory):
+    """Directory of RAID, BRAID, Budget and unrelated files, written once."""
+    d = tmp_path_factory.mktemp("discovery")
+    for name in ("RAID-Log-ProjectA.yaml", "BRAID-Log-ProjectB.yaml",
+                 "Budget-ProjectA.yaml", "Budget-ProjectB.yaml", "Other-File.yaml"):
+        (d / name).write_bytes(b"metadata: {}")
+    return d
 
-    def test_parse_datetime_object(self):
-        """datetime object is accepted (datetime is subclass of date)."""
-        dt = datetime(2024, 12, 15, 10, 30, 0)
-        # Note: datetime is a subclass of date, so isinstance(dt, date) is True
-        # The function returns it as-is, which works since datetime can be used as date
-        result = _parse_date(dt)
-        assert result.year == 2024
-        assert result.month == 12
-        assert result.day == 15
 
-    def test_parse_string_iso_format(self):
-        """ISO format string parses correctly."""
-        assert _parse_date("2024-12-15") == date(2024, 12, 15)
-
-    def test_parse_invalid_string(self):
-        """Invalid string returns None."""
-        assert _parse_date("not-a-date") is None
+class TestParseDateHelper:
+    """Tests for _parse_date helper function."""
 
-    def test_parse_other_types(self):
-        """Other types return None."""
-        assert _parse_date(12345) is None
-        assert _parse_date([2024, 12, 15]) is None
+    @pytest.mark.parametrize("value,expected", [
+        (None, None),
+        (date(2024, 12, 15), date(2024, 12, 15)),
+        # datetime is a subclass of date, so it is returned as-is; compare
+        # against itself because datetime never equals a plain date
+        pytest.param(datetime(2024, 12, 15, 10, 30), datetime(2024, 12, 15, 10, 30),
+                     id="datetime"),
+        ("2024-12-15", date(2024, 12, 15)),
+        ("2024-1-5", date(2024, 1, 5)),
+        ("20241215", None),
+        ("2024-W50-1", None),
+        ("not-a-date", None),
+        (12345, None),
+        ([2024, 12, 15], None),
+    ])
+    def test_parse_date(self, value, expected):
+        """_parse_date accepts dates and ISO strings, anything else is None."""
+        assert _parse_date(value) == expected
 
 
 class TestFormatDateHelper:
     """Tests for _format_date helper function."""
 
-    def test_format_none(self):
-        """None input returns None."""
-        assert _format_date(None) is None
-
-    def test_format_date(self):
-        """date formats as ISO string."""
-        d = date(2024, 12, 15)
-        assert _format_date(d) == "2024-12-15"
+    @pytest.mark.parametrize("value,expected", [
+        (None, None),
+        (date(2024, 12, 15), "2024-12-15"),
+    ])
+    def test_format_date(self, value, expected):
+        """date formats as ISO string, None stays None."""
+        assert _format_date(value) == expected
 
 
 class TestYamlStoreInit:
@@ -92,14 +98,12 @@ class TestYamlStoreInit:
 class TestRaidLogOperations:
     """Tests for RAID log load/save operations."""
 
-    def test_save_and_load_raid_log(self, tmp_path, sample_project):
+    def test_save_and_load_raid_log(self, store, tmp_path, sample_project):
         """Can save and load a RAID log."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Test.yaml"
 
         # Save
         store.save_raid_log(filepath, sample_project)
-        assert filepath.exists()
 
         # Load
         loaded = store.load_raid_log(filepath)
@@ -107,9 +111,8 @@ class TestRaidLogOperations:
         assert loaded.metadata.project_name == sample_project.metadata.project_name
         assert len(loaded.items) == len(sample_project.items)
 
-    def test_load_preserves_metadata(self, tmp_path):
+    def test_load_preserves_metadata(self, store, tmp_path):
         """Loaded metadata matches saved metadata."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Test.yaml"
 
         original = ProjectData(
@@ -134,9 +137,8 @@ class TestRaidLogOperations:
         assert loaded.metadata.next_item_num == 42
         assert loaded.metadata.workstreams == ["Dev", "QA"]
 
-    def test_load_preserves_item_data(self, tmp_path, make_item):
+    def test_load_preserves_item_data(self, store, tmp_path):
         """Loaded items have correct data."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Test.yaml"
 
         original_item = make_item(
@@ -174,9 +176,8 @@ class TestRaidLogOperations:
         assert item.notes == "Some notes here"
         assert item.indicator == "In Progress"
 
-    def test_load_handles_missing_fields(self, tmp_path):
+    def test_load_handles_missing_fields(self, store, tmp_path):
         """Load handles YAML with minimal/missing fields."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Minimal.yaml"
 
         # Write minimal YAML directly
@@ -195,9 +196,8 @@ items:
         assert len(loaded.items) == 1
         assert loaded.items[0].type == "Plan Item"  # Default
 
-    def test_load_handles_dep_item_num_as_strings(self, tmp_path):
+    def test_load_handles_dep_item_num_as_strings(self, store, tmp_path):
         """Load converts string dep_item_num to integers."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Deps.yaml"
 
         filepath.write_text("""
@@ -214,9 +214,8 @@ items:
         loaded = store.load_raid_log(filepath)
         assert loaded.items[0].dep_item_num == [1, 3]
 
-    def test_save_includes_optional_fields(self, tmp_path, make_item):
+    def test_save_includes_optional_fields(self, store, tmp_path):
         """Save includes duration, priority, budget_amount when set."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Full.yaml"
 
         item = make_item(
@@ -234,18 +233,27 @@ items:
         store.save_raid_log(filepath, project)
 
         # Read raw to verify optional fields
-        content = filepath.read_text()
-        assert "duration: 14" in content
-        assert "priority: High" in content
-        assert "budget_amount: 5000" in content
+        content = filepath.read_bytes()
+        assert b"duration: 14" in content
+        assert b"priority: High" in content
+        assert b"budget_amount: 5000" in content
+
+    def test_save_keeps_field_order(self, store, tmp_path, sample_project):
+        """Keys are written in model order, not sorted alphabetically."""
+        filepath = tmp_path / "RAID-Log-Order.yaml"
+        store.save_raid_log(filepath, sample_project)
+
+        content = filepath.read_bytes()
+        assert content.index(b"metadata:") < content.index(b"items:")
+        assert content.index(b"project_name:") < content.index(b"client_name:")
+        assert content.index(b"item_num:") < content.index(b"type:") < content.index(b"title:")
 
 
 class TestBudgetOperations:
     """Tests for Budget load/save operations."""
 
-    def test_save_and_load_budget(self, tmp_path):
+    def test_save_and_load_budget(self, store, tmp_path):
         """Can save and load a Budget file."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "Budget-Test.yaml"
 
         original = BudgetData(
@@ -271,7 +279,6 @@ class TestBudgetOperations:
         )
 
         store.save_budget(filepath, original)
-        assert filepath.exists()
 
         loaded = store.load_budget(filepath)
 
@@ -283,9 +290,8 @@ class TestBudgetOperations:
         assert len(loaded.timesheet_data) == 1
         assert loaded.timesheet_data[0].hours == 40.0
 
-    def test_load_budget_handles_missing_sections(self, tmp_path):
+    def test_load_budget_handles_missing_sections(self, store, tmp_path):
         """Load handles Budget with missing sections."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "Budget-Minimal.yaml"
 
         filepath.write_text("""
@@ -304,16 +310,9 @@ metadata:
 class TestDiscovery:
     """Tests for file discovery methods."""
 
-    def test_find_raid_logs(self, tmp_path):
+    def test_find_raid_logs(self, discovery_dir):
         """find_raid_logs finds RAID and BRAID log files."""
-        store = YamlStore(data_dir=tmp_path)
-
-        # Create test files
-        (tmp_path / "RAID-Log-ProjectA.yaml").write_text("metadata: {}")
-        (tmp_path / "BRAID-Log-ProjectB.yaml").write_text("metadata: {}")
-        (tmp_path / "Other-File.yaml").write_text("metadata: {}")
-
-        files = store.find_raid_logs()
+        files = YamlStore(data_dir=discovery_dir).find_raid_logs()
 
         assert len(files) == 2
         names = [f.name for f in files]
@@ -321,26 +320,64 @@ class TestDiscovery:
         assert "BRAID-Log-ProjectB.yaml" in names
         assert "Other-File.yaml" not in names
 
-    def test_find_budget_files(self, tmp_path):
+    def test_find_budget_files(self, discovery_dir):
         """find_budget_files finds Budget files."""
-        store = YamlStore(data_dir=tmp_path)
-
-        # Create test files
-        (tmp_path / "Budget-ProjectA.yaml").write_text("metadata: {}")
-        (tmp_path / "Budget-ProjectB.yaml").write_text("metadata: {}")
-        (tmp_path / "Other-File.yaml").write_text("metadata: {}")
-
-        files = store.find_budget_files()
+        files = YamlStore(data_dir=discovery_dir).find_budget_files()
 
         assert len(files) == 2
         names = [f.name for f in files]
         assert "Budget-ProjectA.yaml" in names
         assert "Budget-ProjectB.yaml" in names
 
-    def test_find_no_files(self, tmp_path):
+    def test_find_no_files(self, store):
         """Discovery returns empty list when no matching files."""
+        assert store.find_raid_logs() == []
+        assert store.find_budget_files() == []
+
+    def test_find_raid_logs_in(self, discovery_dir, tmp_path):
+        """find_raid_logs_in keeps directory order and skips missing ones."""
+        (tmp_path / "RAID-Log-Local.yaml").write_bytes(b"metadata: {}")
+        dirs = [tmp_path / "missing", tmp_path, discovery_dir]
+
+        files = YamlStore().find_raid_logs_in(dirs)
+
+        assert [f.name for f in files] == [
+            "RAID-Log-Local.yaml", "BRAID-Log-ProjectB.yaml", "RAID-Log-ProjectA.yaml",
+        ]
+        assert files[0].parent == tmp_path
+
+    @pytest.mark.skipif(os.name == "nt", reason="globs ignore case on Windows")
+    def test_find_is_case_sensitive_on_posix(self, tmp_path):
+        """Like Path.glob on POSIX, discovery matches names case-sensitively."""
+        (tmp_path / "raid-log-lower.YAML").write_bytes(b"metadata: {}")
+        (tmp_path / "RAID-Log-Exact.yaml").write_bytes(b"metadata: {}")
+
+        files = YamlStore(data_dir=tmp_path).find_raid_logs()
+
+        assert [f.name for f in files] == ["RAID-Log-Exact.yaml"]
+
+    @pytest.mark.skipif(os.name != "nt", reason="Windows-only case folding")
+    def test_find_ignores_case_on_windows(self, tmp_path):
+        """Like Path.glob on Windows, discovery ignores case and sorts folded."""
+        for name in ("raid-log-b.YAML", "RAID-Log-a.yaml", "budget-x.Yaml"):
+            (tmp_path / name).write_bytes(b"metadata: {}")
         store = YamlStore(data_dir=tmp_path)
 
+        assert [f.name for f in store.find_raid_logs()] == ["RAID-Log-a.yaml", "raid-log-b.YAML"]
+        assert [f.name for f in store.find_budget_files()] == ["budget-x.Yaml"]
+
+    def test_find_unreadable_dir(self, tmp_path, monkeypatch):
+        """Discovery skips a directory it isn't allowed to list."""
+        def denied(path):
+            raise PermissionError(13, "Permission denied", str(path))
+        monkeypatch.setattr(os, "scandir", denied)
+
+        assert YamlStore(data_dir=tmp_path).find_raid_logs() == []
+        assert YamlStore().find_raid_logs_in([tmp_path, tmp_path / "other"]) == []
+
+    def test_find_missing_dir(self, tmp_path):
+        """Discovery returns empty list when the data directory doesn't exist."""
+        store = YamlStore(data_dir=tmp_path / "missing")
         assert store.find_raid_logs() == []
         assert store.find_budget_files() == []
 
@@ -348,9 +385,8 @@ class TestDiscovery:
 class TestRoundTrip:
     """Tests that data survives a save/load cycle intact."""
 
-    def test_full_project_roundtrip(self, tmp_path, sample_project):
+    def test_full_project_roundtrip(self, store, tmp_path, sample_project):
         """Complete project survives roundtrip."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Roundtrip.yaml"
 
         store.save_raid_log(filepath, sample_project)
@@ -365,9 +401,8 @@ class TestRoundTrip:
             assert loaded_item.title == orig.title
             assert loaded_item.type == orig.type
 
-    def test_dates_survive_roundtrip(self, tmp_path, make_item):
+    def test_dates_survive_roundtrip(self, store, tmp_path):
         """Date fields survive roundtrip without loss."""
-        store = YamlStore(data_dir=tmp_path)
         filepath = tmp_path / "RAID-Log-Dates.yaml"
 
         test_date = date(2024, 6, 15)
@@ -399,3 +434,86 @@ class TestRoundTrip:
         assert loaded.items[0].start == test_date
         assert loaded.items[0].finish == test_date
         assert loaded.items[0].deadline == test_date
+
+    def test_tuple_fields_save_as_plain_lists(self, store, tmp_path):
+        """Tuple-valued list fields are written as plain YAML lists."""
+        filepath = tmp_path / "RAID-Log-Tuples.yaml"
+        item = make_item(item_num=1, dep_item_num=(2, 3), rpt_out=("weekly",))
+        project = ProjectData(
+            metadata=ProjectMetadata(project_name="Test", workstreams=("Dev",)),
+            items=[item]
+        )
+
+        store.save_raid_log(filepath, project)
+        loaded = store.load_raid_log(filepath)
+
+        assert b"python/tuple" not in filepath.read_bytes()
+        assert loaded.metadata.workstreams == ["Dev"]
+        assert loaded.items[0].dep_item_num == [2, 3]
+        assert loaded.items[0].rpt_out == ["weekly"]
+
+
+class TestLoadCache:
+    """Tests for reusing the parsed YAML of unchanged files."""
+
+    def test_reload_returns_independent_objects(self, store, tmp_path):
+        """Mutating a loaded project doesn't leak into the next load."""
+        filepath = tmp_path / "RAID-Log-Cache.yaml"
+        item = make_item(item_num=1, rpt_out=["weekly"])
+        project = ProjectData(
+            metadata=ProjectMetadata(project_name="Test", workstreams=["Dev"]),
+            items=[item]
+        )
+        store.save_raid_log(filepath, project)
+
+        first = store.load_raid_log(filepath)
+        first.metadata.workstreams.append("QA")
+        first.items[0].rpt_out.append("monthly")
+        second = store.load_raid_log(filepath)
+
+        assert second.metadata.workstreams == ["Dev"]
+        assert second.items[0].rpt_out == ["weekly"]
+
+    def test_changed_file_is_reparsed(self, store, tmp_path):
+        """Edits made outside the store are picked up on the next load."""
+        filepath = tmp_path / "RAID-Log-Edited.yaml"
+        filepath.write_text("metadata:\n  project_name: Before\nitems: []\n")
+        assert store.load_raid_log(filepath).metadata.project_name == "Before"
+
+        filepath.write_text("metadata:\n  project_name: After edit\nitems: []\n")
+        assert store.load_raid_log(filepath).metadata.project_name == "After edit"
+
+    def test_same_size_edit_with_same_mtime_is_reparsed(self, store, tmp_path):
+        """A same-size edit is seen even when the mtime doesn't move."""
+        filepath = tmp_path / "RAID-Log-Coarse.yaml"
+        filepath.write_text("metadata:\n  project_name: Alpha\nitems: []\n")
+        stat = filepath.stat()
+        assert store.load_raid_log(filepath).metadata.project_name == "Alpha"
+
+        # Same length, timestamps restored - as on FAT/SMB or after a restore
+        filepath.write_text("metadata:\n  project_name: Omega\nitems: []\n")
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert store.load_raid_log(filepath).metadata.project_name == "Omega"
+
+    def test_cache_is_bounded(self, store, tmp_path):
+        """Only the most recently loaded files are kept."""
+        for n in range(_RAW_CACHE_SIZE + 3):
+            filepath = tmp_path / f"RAID-Log-{n}.yaml"
+            filepath.write_text("metadata: {}\nitems: []\n")
+            store.load_raid_log(filepath)
+
+        assert len(_raw_cache) <= _RAW_CACHE_SIZE
+        assert os.path.abspath(filepath) in _raw_cache
+
+    def test_save_invalidates(self, store, tmp_path):
+        """A save through the store is visible to the next load."""
+        filepath = tmp_path / "RAID-Log-Saved.yaml"
+        project = ProjectData(metadata=ProjectMetadata(project_name="Original"), items=[])
+        store.save_raid_log(filepath, project)
+        store.load_raid_log(filepath)
+
+        project.metadata.project_name = "Renamed"
+        store.save_raid_log(filepath, project)
+
+        assert store.load_raid_log(filepath).metadata.project_name == "Renamed"